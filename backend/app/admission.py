@@ -0,0 +1,39 @@
+from fastapi.responses import JSONResponse
+
+from app.config import settings
+
+# Event streams stay open for minutes; they are capped by push_max_subscribers instead.
+ADMISSION_EXEMPT_PATHS = {"/health", "/metrics", "/events/orders"}
+
+
+class AdmissionStats:
+    def __init__(self):
+        self.in_flight = 0
+        self.shed = 0
+
+
+admission_stats = AdmissionStats()
+
+
+class AdmissionControlMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in ADMISSION_EXEMPT_PATHS:
+            return await self.app(scope, receive, send)
+
+        if admission_stats.in_flight >= settings.max_in_flight_requests:
+            admission_stats.shed += 1
+            response = JSONResponse(
+                {"detail": "Server is busy, please retry"},
+                status_code=503,
+                headers={"Retry-After": str(settings.load_shed_retry_after_seconds)}
+            )
+            return await response(scope, receive, send)
+
+        admission_stats.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            admission_stats.in_flight -= 1
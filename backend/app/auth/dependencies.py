@@ -1,47 +1,165 @@
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
 from typing import List
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
 
-from app.database import get_db
-from app.auth.jwt import decode_access_token
+from app.cache import create_cache
+from app.config import settings
+from app.database import get_db, AsyncSessionLocal
+from app.auth.jwt import STREAM_TOKEN_SCOPE, decode_access_token
 from app.models.user import User, UserRole, Country
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
+auth_cache = create_cache(settings.cache_url, settings.auth_cache_max_entries)
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    id: int
+    email: str
+    name: str
+    role: UserRole
+    country: Country
+
+
+def token_cache_key(token: str, scope: str | None) -> str:
+    return f"auth:token:{scope or 'api'}:" + hashlib.sha256(token.encode()).hexdigest()
+
+
+def user_cache_key(user_id: int) -> str:
+    return f"auth:user:{user_id}"
+
+
+pending_invalidations: set[asyncio.Task] = set()
+
+
+async def invalidate_users(user_ids: set[int]):
+    for user_id in user_ids:
+        await auth_cache.delete(user_cache_key(user_id))
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def mark_user_changed(mapper, connection, target: User):
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("changed_users", set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_changed_users(session: Session):
+    user_ids = session.info.pop("changed_users", None)
+    if not user_ids:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        for user_id in user_ids:
+            auth_cache.delete_blocking(user_cache_key(user_id))
+        return
+    task = loop.create_task(invalidate_users(user_ids))
+    pending_invalidations.add(task)
+    task.add_done_callback(pending_invalidations.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_changed_users(session: Session):
+    session.info.pop("changed_users", None)
+
+
+async def resolve_user(token: str, db: AsyncSession, scope: str | None = None) -> CurrentUser:
+    token_key = token_cache_key(token, scope)
+    user_id = await auth_cache.get(token_key)
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    token = credentials.credentials
-    payload = decode_access_token(token)
-    
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token"
-        )
-    
-    user_id = payload.get("sub")
     if user_id is None:
+        payload = decode_access_token(token)
+
+        if payload is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired token"
+            )
+
+        if payload.get("sub") is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token payload"
+            )
+
+        if payload.get("scope") != scope:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token scope"
+            )
+
+        user_id = int(payload["sub"])
+        ttl = min(settings.auth_cache_ttl_seconds, payload["exp"] - time.time())
+        await auth_cache.set(token_key, user_id, ttl)
+
+    snapshot = await auth_cache.get(user_cache_key(user_id))
+    if snapshot is None:
+        user = await db.scalar(select(User).filter(User.id == user_id))
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+        snapshot = {
+            "id": user.id,
+            "email": user.email,
+            "name": user.name,
+            "role": user.role.value,
+            "country": user.country.value
+        }
+        await auth_cache.set(user_cache_key(user_id), snapshot, settings.auth_cache_ttl_seconds)
+
+    return CurrentUser(
+        id=snapshot["id"],
+        email=snapshot["email"],
+        name=snapshot["name"],
+        role=UserRole(snapshot["role"]),
+        country=Country(snapshot["country"])
+    )
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+) -> CurrentUser:
+    return await resolve_user(credentials.credentials, db)
+
+
+async def get_stream_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_security),
+    stream_token: str | None = Query(None)
+) -> CurrentUser:
+    # EventSource cannot send headers, so streams also accept ?stream_token=.
+    # Query strings end up in access logs, so only short-lived stream-scoped
+    # tokens from POST /events/token are accepted there, never access tokens.
+    # The session is scoped to the lookup so a long-lived stream holds no connection.
+    if credentials:
+        token, scope = credentials.credentials, None
+    elif stream_token:
+        token, scope = stream_token, STREAM_TOKEN_SCOPE
+    else:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload"
-        )
-    
-    user = db.query(User).filter(User.id == int(user_id)).first()
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
+            detail="Not authenticated"
         )
-    
-    return user
+    async with AsyncSessionLocal() as db:
+        return await resolve_user(token, db, scope)
 
 
 def require_roles(allowed_roles: List[UserRole]):
-    def role_checker(current_user: User = Depends(get_current_user)) -> User:
+    async def role_checker(current_user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
         if current_user.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -51,7 +169,7 @@ def require_roles(allowed_roles: List[UserRole]):
     return role_checker
 
 
-def get_country_filter(user: User) -> Country | None:
+def get_country_filter(user: CurrentUser) -> Country | None:
     if user.role == UserRole.ADMIN or user.country == Country.GLOBAL:
         return None
     return user.country
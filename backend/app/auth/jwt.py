@@ -4,9 +4,13 @@ from jose import jwt, JWTError
 from app.config import settings
 
 
-def create_access_token(data: dict) -> str:
+# Scope of the short-lived tokens EventSource clients pass in the query string.
+STREAM_TOKEN_SCOPE = "order_events"
+
+
+def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=settings.jwt_expire_minutes)
+    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.jwt_expire_minutes))
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
@@ -1,10 +1,98 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
+from app.config import settings
+
+password_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="password-hash"
+)
+
+
+class PasswordPoolBusy(Exception):
+    pass
+
+
+class PasswordPoolStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.queue_seconds = 0.0
+        self.run_seconds = 0.0
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "workers": settings.password_hash_workers,
+                "max_pending": settings.password_hash_max_pending,
+                "pending": self.pending,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "queue_seconds": self.queue_seconds,
+                "run_seconds": self.run_seconds,
+            }
+
+
+password_pool_stats = PasswordPoolStats()
+
 
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=settings.bcrypt_rounds)).decode()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    try:
+        return int(hashed_password.split("$")[2]) != settings.bcrypt_rounds
+    except (IndexError, ValueError):
+        return True
+
+
+def run_timed(submitted_at: float, func, *args):
+    started_at = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        finished_at = time.perf_counter()
+        with password_pool_stats.lock:
+            password_pool_stats.queue_seconds += started_at - submitted_at
+            password_pool_stats.run_seconds += finished_at - started_at
+
+
+async def run_in_password_pool(func, *args):
+    stats = password_pool_stats
+    with stats.lock:
+        if stats.pending >= settings.password_hash_max_pending:
+            stats.rejected += 1
+            raise PasswordPoolBusy()
+        stats.pending += 1
+        stats.submitted += 1
+
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            password_executor, run_timed, time.perf_counter(), func, *args
+        )
+    finally:
+        with stats.lock:
+            stats.pending -= 1
+            stats.completed += 1
+
+
+async def hash_password_async(password: str) -> str:
+    return await run_in_password_pool(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await run_in_password_pool(verify_password, plain_password, hashed_password)
@@ -0,0 +1,130 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class CacheBackend:
+    async def get(self, key: str) -> Any | None:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        raise NotImplementedError
+
+    async def add(self, key: str, value: Any, ttl: float) -> bool:
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def delete_blocking(self, key: str) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryCache(CacheBackend):
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _store(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._store(key, value, ttl)
+
+    async def add(self, key: str, value: Any, ttl: float) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return False
+            self._store(key, value, ttl)
+            return True
+
+    async def delete(self, key: str) -> None:
+        self.delete_blocking(key)
+
+    def delete_blocking(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCache(CacheBackend):
+    def __init__(self, url: str, prefix: str = "slooze:"):
+        import redis.asyncio as redis
+
+        self.url = url
+        self.client = redis.Redis.from_url(url)
+        self.blocking_client = None
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Any | None:
+        raw = await self.client.get(self.prefix + key)
+        return None if raw is None else json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        await self.client.set(self.prefix + key, json.dumps(value), px=int(ttl * 1000))
+
+    async def add(self, key: str, value: Any, ttl: float) -> bool:
+        return bool(await self.client.set(self.prefix + key, json.dumps(value), px=int(ttl * 1000), nx=True))
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.prefix + key)
+
+    def delete_blocking(self, key: str) -> None:
+        # For writers without an event loop (manage.py, seed.py, scripts).
+        if self.blocking_client is None:
+            import redis
+
+            self.blocking_client = redis.Redis.from_url(self.url)
+        self.blocking_client.delete(self.prefix + key)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+        if self.blocking_client is not None:
+            self.blocking_client.close()
+
+
+caches: list[CacheBackend] = []
+
+
+def create_cache(url: str, max_entries: int = 10000) -> CacheBackend:
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        cache = RedisCache(url)
+    else:
+        cache = MemoryCache(max_entries)
+    caches.append(cache)
+    return cache
+
+
+async def close_caches():
+    for cache in caches:
+        await cache.close()
@@ -0,0 +1,108 @@
+import orjson
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.cache import create_cache
+from app.config import settings
+from app.etag import make_etag
+from app.models.restaurant import Restaurant, MenuItem, CatalogVersion
+from app.models.user import Country
+from app.schemas.restaurant import RestaurantDetailResponse
+from app.search import search_catalog, search_terms
+
+catalog_cache = create_cache(settings.cache_url, settings.catalog_cache_max_entries)
+
+
+async def catalog_version(db: AsyncSession) -> int:
+    # Bumped by triggers on restaurants and menu_items, so writes from any
+    # process or from plain SQL move every worker onto fresh cache keys.
+    return await db.scalar(select(CatalogVersion.version).filter(CatalogVersion.id == 1)) or 0
+
+
+def restaurant_list_key(version: int, country: Country | None) -> str:
+    return f"catalog:{version}:restaurants:{country.value if country else 'all'}"
+
+
+def restaurant_detail_key(version: int, restaurant_id: int) -> str:
+    return f"catalog:{version}:restaurant:{restaurant_id}"
+
+
+def search_key(version: int, country: Country | None, query: str, limit: int, offset: int) -> str:
+    terms = " ".join(search_terms(query))
+    return f"catalog:{version}:search:{country.value if country else 'all'}:{limit}:{offset}:{terms}"
+
+
+async def load_restaurant_list_json(db: AsyncSession, country: Country | None) -> str:
+    query = select(
+        Restaurant.id,
+        Restaurant.name,
+        Restaurant.description,
+        Restaurant.image_url,
+        Restaurant.country
+    ).order_by(Restaurant.id)
+    if country:
+        query = query.filter(Restaurant.country == country)
+    return orjson.dumps([
+        {
+            "id": restaurant_id,
+            "name": name,
+            "description": description,
+            "image_url": image_url,
+            "country": restaurant_country.value
+        }
+        for restaurant_id, name, description, image_url, restaurant_country in await db.execute(query)
+    ]).decode()
+
+
+async def get_restaurant_list_json(db: AsyncSession, country: Country | None, version: int) -> dict:
+    key = restaurant_list_key(version, country)
+    entry = await catalog_cache.get(key)
+
+    if entry is None:
+        body = await load_restaurant_list_json(db, country)
+        entry = {"body": body, "etag": make_etag(body)}
+        await catalog_cache.set(key, entry, settings.catalog_cache_ttl_seconds)
+
+    return entry
+
+
+async def get_restaurant_detail_json(db: AsyncSession, restaurant_id: int, version: int) -> dict | None:
+    key = restaurant_detail_key(version, restaurant_id)
+    entry = await catalog_cache.get(key)
+
+    if entry is None:
+        restaurant = await db.scalar(
+            select(Restaurant).options(selectinload(Restaurant.menu_items)).filter(
+                Restaurant.id == restaurant_id
+            )
+        )
+        if not restaurant:
+            return None
+        body = RestaurantDetailResponse.model_validate(restaurant).model_dump_json()
+        entry = {"country": restaurant.country.value, "body": body, "etag": make_etag(body)}
+        await catalog_cache.set(key, entry, settings.catalog_cache_ttl_seconds)
+
+    return entry
+
+
+async def get_search_json(
+    db: AsyncSession,
+    query: str,
+    country: Country | None,
+    limit: int,
+    offset: int,
+    version: int
+) -> dict:
+    key = search_key(version, country, query, limit, offset)
+    entry = await catalog_cache.get(key)
+
+    if entry is None:
+        results = await search_catalog(db, query, country, limit + 1, offset)
+        body = orjson.dumps(results[:limit]).decode()
+        next_offset = offset + limit if len(results) > limit else None
+        entry = {"body": body, "next_offset": next_offset, "etag": make_etag(body, next_offset)}
+        await catalog_cache.set(key, entry, settings.catalog_cache_ttl_seconds)
+
+    return entry
+
@@ -3,9 +3,77 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     database_url: str = "sqlite:///./slooze_eats.db"
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_pool_timeout: int = 30
+    database_pool_pre_ping: bool = True
+    database_pool_recycle: int = 1800
+    database_max_connections: int = 0
+    database_connect_on_startup: bool = True
+    database_replica_url: str | None = None
+    database_replica_pin_seconds: float = 5.0
+    database_replica_max_connections: int = 0
+    sqlite_tuned: bool = True
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 268435456
+    sqlite_cache_size_kb: int = 65536
+    sqlite_serialize_writes: bool = True
     jwt_secret: str = "slooze-eats-secret-key-change-in-production"
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 1440
+    stream_token_expire_seconds: int = 60
+    cache_url: str = "memory://"
+    auth_cache_ttl_seconds: int = 60
+    auth_cache_max_entries: int = 10000
+    catalog_cache_ttl_seconds: int = 3600
+    catalog_cache_max_entries: int = 10000
+    catalog_http_max_age_seconds: int = 60
+    idempotency_ttl_seconds: int = 900
+    idempotency_lock_seconds: int = 30
+    idempotency_max_entries: int = 10000
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 4
+    password_hash_max_pending: int = 64
+    rate_limit_enabled: bool = True
+    rate_limit_url: str = "memory://"
+    rate_limit_max_keys: int = 100000
+    rate_limit_default: str = "300/minute"
+    rate_limits: dict[str, str] = {
+        "login": "10/minute",
+        "add_to_cart": "120/minute",
+        "update_cart_items": "60/minute",
+        "remove_from_cart": "120/minute",
+        "checkout": "30/minute",
+        "export_orders": "6/minute",
+        "search_restaurants": "120/minute",
+        "order_events": "30/minute",
+    }
+    max_in_flight_requests: int = 256
+    load_shed_retry_after_seconds: int = 1
+    outbox_workers: int = 1
+    outbox_batch_size: int = 100
+    outbox_poll_seconds: float = 1.0
+    outbox_lease_seconds: int = 60
+    outbox_max_attempts: int = 8
+    outbox_backoff_base_seconds: float = 1.0
+    outbox_backoff_max_seconds: float = 300.0
+    push_broker_url: str = "memory://"
+    push_queue_size: int = 100
+    push_max_subscribers: int = 1000
+    push_heartbeat_seconds: float = 15.0
+    push_stream_max_seconds: float = 300.0
+    web_host: str = "0.0.0.0"
+    web_port: int = 8000
+    web_workers: int = 1
+    web_preload: bool = True
+    web_graceful_timeout: int = 30
+    web_keepalive_seconds: int = 5
+    web_max_requests: int = 0
+    web_max_requests_jitter: int = 0
+    metrics_enabled: bool = True
+    profile_sample_rate: float = 0.0
+    profile_slow_threshold_ms: float = 500.0
+    profile_dir: str = "profiles"
 
     class Config:
         env_file = ".env"
@@ -1,21 +1,148 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import asyncio
+from functools import lru_cache
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 
 from app.config import settings
 
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False}
-)
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+
+def async_database_url(url: str) -> str:
+    parsed = make_url(url)
+    return parsed.set(
+        drivername=ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    ).render_as_string(hide_password=False)
+
+
+def pool_options(max_connections: int) -> dict:
+    pool_size, max_overflow = settings.database_pool_size, settings.database_max_overflow
+    if max_connections:
+        # The connection budget is shared by every web worker process.
+        per_worker = max(1, max_connections // max(1, settings.web_workers))
+        pool_size = min(pool_size, per_worker)
+        max_overflow = min(max_overflow, per_worker - pool_size)
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+        "pool_pre_ping": settings.database_pool_pre_ping,
+        "pool_recycle": settings.database_pool_recycle,
+    }
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+is_sqlite = settings.database_url.startswith("sqlite")
 
 Base = declarative_base()
 
+sqlite_write_lock = asyncio.Lock()
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}")
+    cursor.execute(f"PRAGMA mmap_size={settings.sqlite_mmap_size}")
+    cursor.execute(f"PRAGMA cache_size=-{settings.sqlite_cache_size_kb}")
+    cursor.close()
+
+
+@lru_cache
+def get_engine() -> Engine:
+    engine = create_engine(
+        settings.database_url,
+        connect_args={"check_same_thread": False} if is_sqlite else {},
+        **pool_options(settings.database_max_connections)
+    )
+    if is_sqlite and settings.sqlite_tuned:
+        event.listen(engine, "connect", apply_sqlite_pragmas)
+    return engine
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    async_engine = create_async_engine(
+        async_database_url(settings.database_url),
+        **pool_options(settings.database_max_connections)
+    )
+    if is_sqlite and settings.sqlite_tuned:
+        event.listen(async_engine.sync_engine, "connect", apply_sqlite_pragmas)
+    return async_engine
+
+
+def apply_replica_pragmas(dbapi_connection, connection_record):
+    if settings.sqlite_tuned:
+        apply_sqlite_pragmas(dbapi_connection, connection_record)
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+
+@lru_cache
+def get_read_async_engine() -> AsyncEngine:
+    if not settings.database_replica_url:
+        return get_async_engine()
+    read_engine = create_async_engine(
+        async_database_url(settings.database_replica_url),
+        **pool_options(settings.database_replica_max_connections)
+    )
+    if settings.database_replica_url.startswith("sqlite"):
+        event.listen(read_engine.sync_engine, "connect", apply_replica_pragmas)
+    return read_engine
+
 
-def get_db():
-    db = SessionLocal()
-    try:
+@lru_cache
+def session_factory() -> sessionmaker:
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+
+@lru_cache
+def async_session_factory() -> async_sessionmaker:
+    return async_sessionmaker(get_async_engine(), autoflush=False, expire_on_commit=False)
+
+
+@lru_cache
+def read_session_factory() -> async_sessionmaker:
+    return async_sessionmaker(get_read_async_engine(), autoflush=False, expire_on_commit=False)
+
+
+def SessionLocal() -> Session:
+    return session_factory()()
+
+
+def AsyncSessionLocal() -> AsyncSession:
+    return async_session_factory()()
+
+
+def ReadSessionLocal() -> AsyncSession:
+    return read_session_factory()()
+
+
+async def dispose_engines():
+    if settings.database_replica_url and get_read_async_engine.cache_info().currsize:
+        await get_read_async_engine().dispose()
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
+
+
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+async def serialized_writes():
+    if not (is_sqlite and settings.sqlite_serialize_writes):
+        yield
+        return
+    async with sqlite_write_lock:
+        yield
@@ -0,0 +1,19 @@
+import hashlib
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def not_modified(headers: dict) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
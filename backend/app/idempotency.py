@@ -0,0 +1,66 @@
+import hashlib
+from dataclasses import dataclass
+
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel
+
+from app.cache import create_cache
+from app.config import settings
+
+idempotency_cache = create_cache(settings.cache_url, settings.idempotency_max_entries)
+
+
+def idempotency_cache_key(scope: str, user_id: int, key: str) -> str:
+    return f"idempotency:{scope}:{user_id}:" + hashlib.sha256(key.encode()).hexdigest()
+
+
+@dataclass
+class IdempotencyClaim:
+    cache_key: str | None
+    fingerprint: str | None = None
+    replay: Response | None = None
+
+    async def release(self):
+        if self.cache_key:
+            await idempotency_cache.delete(self.cache_key)
+
+    async def complete(self, payload: BaseModel) -> Response:
+        body = payload.model_dump_json()
+        if self.cache_key:
+            await idempotency_cache.set(
+                self.cache_key,
+                {"fingerprint": self.fingerprint, "status_code": status.HTTP_200_OK, "body": body},
+                settings.idempotency_ttl_seconds
+            )
+        return Response(content=body, media_type="application/json")
+
+
+async def claim_idempotency_key(scope: str, user_id: int, key: str | None, request: BaseModel) -> IdempotencyClaim:
+    if key is None:
+        return IdempotencyClaim(None)
+
+    cache_key = idempotency_cache_key(scope, user_id, key)
+    fingerprint = hashlib.sha256(request.model_dump_json().encode()).hexdigest()
+
+    if await idempotency_cache.add(cache_key, {"fingerprint": fingerprint}, settings.idempotency_lock_seconds):
+        return IdempotencyClaim(cache_key, fingerprint)
+
+    entry = await idempotency_cache.get(cache_key)
+    if entry is not None and entry["fingerprint"] != fingerprint:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Idempotency-Key was already used with a different request"
+        )
+    if entry is None or "body" not in entry:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A request with this Idempotency-Key is still in progress",
+            headers={"Retry-After": "1"}
+        )
+
+    return IdempotencyClaim(None, replay=Response(
+        content=entry["body"],
+        status_code=entry["status_code"],
+        media_type="application/json",
+        headers={"Idempotent-Replayed": "true"}
+    ))
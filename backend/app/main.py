@@ -1,31 +1,92 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse
+from sqlalchemy import text
+
+from app.admission import AdmissionControlMiddleware
+from app.cache import close_caches
+from app.config import settings
+from app.database import dispose_engines, get_async_engine
+from app.metrics import MetricsMiddleware, metrics_registry
+from app.outbox import start_outbox_workers, stop_outbox_workers
+from app.push import push_broker, close_streams_on_shutdown_signals
+from app.ratelimit import rate_limit_by_ip, rate_limit_by_user, rate_limiter
+from app.replicas import pin_writers_to_primary
+from app.routes import auth, restaurants, orders, payments, reports, events
+
 
-from app.database import engine, Base
-from app.routes import auth, restaurants, orders, payments
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.database_connect_on_startup:
+        async with get_async_engine().connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    await push_broker.start()
+    close_streams_on_shutdown_signals()
+    if settings.outbox_workers > 0:
+        start_outbox_workers(settings.outbox_workers)
+    yield
+    await stop_outbox_workers()
+    await push_broker.stop()
+    await close_caches()
+    await rate_limiter.close()
+    await dispose_engines()
 
-Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title="Slooze Eats API",
     description="Food ordering API with role-based access control",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
+if settings.max_in_flight_requests > 0:
+    app.add_middleware(AdmissionControlMiddleware)
+
+# Added last so it is outermost and shed 503s still carry CORS headers.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Next-Offset", "ETag", "Server-Timing", "Idempotent-Replayed"],
 )
 
-app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
-app.include_router(restaurants.router, prefix="/restaurants", tags=["Restaurants"])
-app.include_router(orders.router, prefix="/orders", tags=["Orders"])
-app.include_router(payments.router, prefix="/payments", tags=["Payments"])
+app.include_router(
+    auth.router, prefix="/auth", tags=["Authentication"], dependencies=[Depends(rate_limit_by_ip)]
+)
+app.include_router(
+    restaurants.router, prefix="/restaurants", tags=["Restaurants"], dependencies=[Depends(rate_limit_by_user)]
+)
+app.include_router(
+    orders.router,
+    prefix="/orders",
+    tags=["Orders"],
+    dependencies=[Depends(rate_limit_by_user), Depends(pin_writers_to_primary)]
+)
+app.include_router(
+    payments.router,
+    prefix="/payments",
+    tags=["Payments"],
+    dependencies=[Depends(rate_limit_by_user), Depends(pin_writers_to_primary)]
+)
+app.include_router(
+    reports.router, prefix="/reports", tags=["Reports"], dependencies=[Depends(rate_limit_by_user)]
+)
+app.include_router(events.router, prefix="/events", tags=["Events"])
 
 
 @app.get("/health")
 def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics():
+    return metrics_registry.render()
@@ -0,0 +1,205 @@
+import cProfile
+import os
+import random
+import re
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.admission import admission_stats
+from app.auth.password import password_pool_stats
+from app.config import settings
+from app.outbox import outbox_stats
+from app.push import push_hub
+from app.ratelimit import rate_limit_stats
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+
+
+current_request_stats: ContextVar[RequestStats | None] = ContextVar("current_request_stats", default=None)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latency = {}
+        self.db_statements = {}
+        self.db_seconds = {}
+
+    def observe(self, method: str, route: str, status_code: int, seconds: float, stats: RequestStats):
+        key = (method, route, str(status_code))
+        with self.lock:
+            buckets, total, count = self.latency.get(key, ([0] * len(LATENCY_BUCKETS), 0.0, 0))
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    buckets[index] += 1
+            self.latency[key] = (buckets, total + seconds, count + 1)
+            self.db_statements[(method, route)] = self.db_statements.get((method, route), 0) + stats.queries
+            self.db_seconds[(method, route)] = self.db_seconds.get((method, route), 0.0) + stats.db_seconds
+
+    def render(self) -> str:
+        lines = [
+            "# HELP http_request_duration_seconds Request latency by route.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        with self.lock:
+            for (method, route, status_code), (buckets, total, count) in sorted(self.latency.items()):
+                labels = f'method="{method}",route="{route}",status="{status_code}"'
+                for bound, bucket_count in zip(LATENCY_BUCKETS, buckets):
+                    lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {bucket_count}')
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {count}')
+                lines.append(f"http_request_duration_seconds_sum{{{labels}}} {total}")
+                lines.append(f"http_request_duration_seconds_count{{{labels}}} {count}")
+
+            lines += [
+                "# HELP db_statements_total SQL statements executed while serving a route.",
+                "# TYPE db_statements_total counter",
+            ]
+            for (method, route), count in sorted(self.db_statements.items()):
+                lines.append(f'db_statements_total{{method="{method}",route="{route}"}} {count}')
+
+            lines += [
+                "# HELP db_time_seconds_total Time spent executing SQL while serving a route.",
+                "# TYPE db_time_seconds_total counter",
+            ]
+            for (method, route), seconds in sorted(self.db_seconds.items()):
+                lines.append(f'db_time_seconds_total{{method="{method}",route="{route}"}} {seconds}')
+
+        password_stats = password_pool_stats.snapshot()
+        lines += [
+            "# HELP password_hash_pending Password hashing jobs queued or running.",
+            "# TYPE password_hash_pending gauge",
+            f"password_hash_pending {password_stats['pending']}",
+            "# HELP password_hash_rejected_total Password hashing jobs rejected because the pool was full.",
+            "# TYPE password_hash_rejected_total counter",
+            f"password_hash_rejected_total {password_stats['rejected']}",
+            "# HELP password_hash_queue_seconds_total Time password hashing jobs waited for a worker.",
+            "# TYPE password_hash_queue_seconds_total counter",
+            f"password_hash_queue_seconds_total {password_stats['queue_seconds']}",
+            "# HELP http_requests_in_flight Requests currently being served.",
+            "# TYPE http_requests_in_flight gauge",
+            f"http_requests_in_flight {admission_stats.in_flight}",
+            "# HELP http_requests_shed_total Requests rejected with 503 because too many were in flight.",
+            "# TYPE http_requests_shed_total counter",
+            f"http_requests_shed_total {admission_stats.shed}",
+            "# HELP http_requests_rate_limited_total Requests rejected with 429 by the rate limiter.",
+            "# TYPE http_requests_rate_limited_total counter",
+            f"http_requests_rate_limited_total {rate_limit_stats.rejected}",
+            "# HELP outbox_events_delivered_total Outbox events handled successfully.",
+            "# TYPE outbox_events_delivered_total counter",
+            f"outbox_events_delivered_total {outbox_stats.delivered}",
+            "# HELP outbox_events_retried_total Outbox deliveries that failed and were rescheduled.",
+            "# TYPE outbox_events_retried_total counter",
+            f"outbox_events_retried_total {outbox_stats.retried}",
+            "# HELP outbox_events_failed_total Outbox events parked after exhausting their attempts.",
+            "# TYPE outbox_events_failed_total counter",
+            f"outbox_events_failed_total {outbox_stats.failed}",
+            "# HELP push_subscribers Open order event streams in this process.",
+            "# TYPE push_subscribers gauge",
+            f"push_subscribers {len(push_hub.subscribers)}",
+            "# HELP push_subscribers_dropped_total Event streams closed because the client fell behind.",
+            "# TYPE push_subscribers_dropped_total counter",
+            f"push_subscribers_dropped_total {push_hub.dropped}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+
+def record_query(context):
+    started_at = getattr(context, "query_started_at", None)
+    if started_at is None:
+        return
+    del context.query_started_at
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += time.perf_counter() - started_at
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context.query_started_at = time.perf_counter()
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    record_query(context)
+
+
+def handle_error(exception_context):
+    # Failed statements never reach after_cursor_execute; count their time too.
+    record_query(exception_context.execution_context)
+
+
+event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+event.listen(Engine, "after_cursor_execute", after_cursor_execute)
+event.listen(Engine, "handle_error", handle_error)
+
+
+profile_lock = threading.Lock()
+
+
+def write_profile(profiler: cProfile.Profile, method: str, route: str, seconds: float):
+    os.makedirs(settings.profile_dir, exist_ok=True)
+    route_name = re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_") or "root"
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}-{method}-{route_name}-{int(seconds * 1000)}ms.prof"
+    profiler.dump_stats(os.path.join(settings.profile_dir, name))
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        started_at = time.perf_counter()
+        status_code = 500
+
+        profiler = None
+        if settings.profile_sample_rate > 0 and random.random() < settings.profile_sample_rate:
+            if profile_lock.acquire(blocking=False):
+                profiler = cProfile.Profile()
+                profiler.enable()
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed_ms = (time.perf_counter() - started_at) * 1000
+                server_timing = (
+                    f'app;dur={elapsed_ms:.1f}, '
+                    f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries"'
+                )
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", server_timing.encode())
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            current_request_stats.reset(token)
+            route = scope.get("route")
+            route_path = route.path if route is not None else "unmatched"
+            metrics_registry.observe(scope["method"], route_path, status_code, elapsed, stats)
+
+            if profiler is not None:
+                profiler.disable()
+                profile_lock.release()
+                if elapsed * 1000 >= settings.profile_slow_threshold_ms:
+                    write_profile(profiler, scope["method"], route_path, elapsed)
@@ -0,0 +1,2 @@
+from app.models import user, restaurant, order, payment, report, outbox
+from app import search
@@ -1,6 +1,6 @@
 import enum
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Enum, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, Enum, DateTime, Index, text
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -20,13 +20,31 @@ class Order(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     status = Column(Enum(OrderStatus), default=OrderStatus.CART, nullable=False)
-    total_amount = Column(Float, default=0.0)
+    total_minor = Column(Integer, default=0, nullable=False)
     country = Column(Enum(Country), nullable=False)
+    version = Column(Integer, default=1, server_default="1", nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    placed_at = Column(DateTime)
 
     user = relationship("User", back_populates="orders")
-    items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan")
+    items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan", order_by="OrderItem.id")
+
+    __table_args__ = (
+        Index("ix_orders_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_orders_country_status_created_at_id", "country", "status", "created_at", "id"),
+        Index("ix_orders_country_created_at_id", "country", "created_at", "id"),
+        Index("ix_orders_user_id_status_created_at_id", "user_id", "status", "created_at", "id"),
+        Index("ix_orders_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_orders_created_at_id", "created_at", "id"),
+        Index(
+            "uq_orders_user_id_cart",
+            "user_id",
+            unique=True,
+            sqlite_where=text("status = 'CART'"),
+            postgresql_where=text("status = 'CART'")
+        ),
+    )
 
 
 class OrderItem(Base):
@@ -36,7 +54,12 @@ class OrderItem(Base):
     order_id = Column(Integer, ForeignKey("orders.id"), nullable=False)
     menu_item_id = Column(Integer, ForeignKey("menu_items.id"), nullable=False)
     quantity = Column(Integer, default=1)
-    price = Column(Float, nullable=False)
+    price_minor = Column(Integer, nullable=False)
 
     order = relationship("Order", back_populates="items")
     menu_item = relationship("MenuItem")
+
+    __table_args__ = (
+        Index("uq_order_items_order_id_menu_item_id", "order_id", "menu_item_id", unique=True),
+        Index("ix_order_items_order_id_id", "order_id", "id"),
+    )
@@ -0,0 +1,27 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, text
+
+from app.database import Base
+
+
+class OutboxEvent(Base):
+    __tablename__ = "outbox_events"
+
+    id = Column(Integer, primary_key=True)
+    topic = Column(String, nullable=False)
+    payload = Column(Text, nullable=False)
+    attempts = Column(Integer, default=0, server_default="0", nullable=False)
+    last_error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    available_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    failed_at = Column(DateTime)
+
+    __table_args__ = (
+        Index(
+            "ix_outbox_events_due",
+            "available_at",
+            "id",
+            sqlite_where=text("failed_at IS NULL"),
+            postgresql_where=text("failed_at IS NULL")
+        ),
+    )
@@ -15,7 +15,7 @@ class PaymentMethod(Base):
     __tablename__ = "payment_methods"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     type = Column(Enum(PaymentType), nullable=False)
     last_four = Column(String(4), nullable=False)
     is_default = Column(Boolean, default=False)
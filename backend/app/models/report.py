@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Integer, Date, ForeignKey, Enum
+
+from app.database import Base
+from app.models.user import Country
+
+
+class CountrySalesDaily(Base):
+    __tablename__ = "country_sales_daily"
+
+    day = Column(Date, primary_key=True)
+    country = Column(Enum(Country), primary_key=True)
+    orders_placed = Column(Integer, default=0, nullable=False)
+    orders_cancelled = Column(Integer, default=0, nullable=False)
+    revenue_minor = Column(Integer, default=0, nullable=False)
+
+
+class RestaurantSalesDaily(Base):
+    __tablename__ = "restaurant_sales_daily"
+
+    day = Column(Date, primary_key=True)
+    country = Column(Enum(Country), primary_key=True)
+    restaurant_id = Column(Integer, ForeignKey("restaurants.id"), primary_key=True)
+    orders_placed = Column(Integer, default=0, nullable=False)
+    orders_cancelled = Column(Integer, default=0, nullable=False)
+    revenue_minor = Column(Integer, default=0, nullable=False)
+    items_sold = Column(Integer, default=0, nullable=False)
+
+
+class MenuItemSalesDaily(Base):
+    __tablename__ = "menu_item_sales_daily"
+
+    day = Column(Date, primary_key=True)
+    country = Column(Enum(Country), primary_key=True)
+    menu_item_id = Column(Integer, ForeignKey("menu_items.id"), primary_key=True)
+    restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False)
+    quantity = Column(Integer, default=0, nullable=False)
+    revenue_minor = Column(Integer, default=0, nullable=False)
@@ -12,7 +12,7 @@ class Restaurant(Base):
     name = Column(String, nullable=False)
     description = Column(String)
     image_url = Column(String)
-    country = Column(Enum(Country), nullable=False)
+    country = Column(Enum(Country), nullable=False, index=True)
 
     menu_items = relationship("MenuItem", back_populates="restaurant")
 
@@ -21,10 +21,17 @@ class MenuItem(Base):
     __tablename__ = "menu_items"
 
     id = Column(Integer, primary_key=True, index=True)
-    restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False)
+    restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False, index=True)
     name = Column(String, nullable=False)
     description = Column(String)
     price = Column(Float, nullable=False)
     image_url = Column(String)
 
     restaurant = relationship("Restaurant", back_populates="menu_items")
+
+
+class CatalogVersion(Base):
+    __tablename__ = "catalog_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, default=0, nullable=False)
@@ -0,0 +1,11 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+MINOR_UNITS = 100
+
+
+def to_minor(amount) -> int:
+    return int((Decimal(str(amount)) * MINOR_UNITS).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def to_major(minor: int) -> float:
+    return minor / MINOR_UNITS
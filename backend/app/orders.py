@@ -0,0 +1,41 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.order import Order, OrderItem
+from app.models.restaurant import MenuItem
+from app.money import to_major
+from app.schemas.order import OrderResponse, OrderItemResponse
+
+
+def order_query():
+    return select(Order).options(
+        selectinload(Order.items).joinedload(OrderItem.menu_item).load_only(MenuItem.name)
+    )
+
+
+async def load_order(db: AsyncSession, order_id: int) -> Order:
+    result = await db.execute(
+        order_query().filter(Order.id == order_id).execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+def get_order_response(order: Order) -> OrderResponse:
+    items = []
+    for item in order.items:
+        items.append(OrderItemResponse(
+            id=item.id,
+            menu_item_id=item.menu_item_id,
+            menu_item_name=item.menu_item.name,
+            quantity=item.quantity,
+            price=to_major(item.price_minor)
+        ))
+    return OrderResponse(
+        id=order.id,
+        status=order.status,
+        total_amount=to_major(order.total_minor),
+        country=order.country,
+        created_at=order.created_at,
+        items=items
+    )
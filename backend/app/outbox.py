@@ -0,0 +1,195 @@
+import asyncio
+import logging
+import random
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+import orjson
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal, serialized_writes
+from app.models.order import Order, OrderStatus
+from app.models.outbox import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+OutboxHandler = Callable[[dict], Awaitable[None]]
+
+outbox_handlers: dict[str, list[OutboxHandler]] = {}
+
+outbox_write_lock = asynccontextmanager(serialized_writes)
+
+
+# Delivery is at least once, per event: when any handler for a topic raises,
+# every handler for that topic runs again on the retry. Handlers must be
+# idempotent, e.g. by keying their effects on the payload's order version.
+def outbox_handler(*topics: str):
+    def register(handler: OutboxHandler) -> OutboxHandler:
+        for topic in topics:
+            outbox_handlers.setdefault(topic, []).append(handler)
+        return handler
+    return register
+
+
+def enqueue_event(db: AsyncSession, topic: str, payload: dict):
+    db.add(OutboxEvent(topic=topic, payload=orjson.dumps(payload).decode()))
+
+
+def enqueue_order_event(db: AsyncSession, order: Order, order_status: OrderStatus, version: int):
+    enqueue_event(db, f"order.{order_status.value}", {
+        "order_id": order.id,
+        "user_id": order.user_id,
+        "country": order.country.value,
+        "status": order_status.value,
+        "version": version,
+        "occurred_at": datetime.utcnow().isoformat()
+    })
+
+
+@outbox_handler("order.placed", "order.cancelled")
+async def log_order_event(payload: dict):
+    logger.info("order %s is now %s", payload["order_id"], payload["status"])
+
+
+class OutboxStats:
+    def __init__(self):
+        self.delivered = 0
+        self.retried = 0
+        self.failed = 0
+
+
+outbox_stats = OutboxStats()
+
+
+def backoff_seconds(attempts: int) -> float:
+    delay = settings.outbox_backoff_base_seconds * 2 ** (attempts - 1)
+    return min(delay, settings.outbox_backoff_max_seconds) * random.uniform(0.5, 1.0)
+
+
+async def claim_events(limit: int) -> list:
+    now = datetime.utcnow()
+    due = select(OutboxEvent.id).filter(
+        OutboxEvent.failed_at.is_(None),
+        OutboxEvent.available_at <= now
+    ).order_by(OutboxEvent.available_at, OutboxEvent.id).limit(limit).with_for_update(skip_locked=True)
+
+    # Claiming pushes available_at out by the lease, so a worker that dies
+    # mid-batch only delays its events instead of losing them.
+    async with outbox_write_lock(), AsyncSessionLocal() as db:
+        events = (await db.execute(
+            update(OutboxEvent).filter(
+                OutboxEvent.id.in_(due.scalar_subquery()),
+                OutboxEvent.available_at <= now
+            ).values(
+                available_at=now + timedelta(seconds=settings.outbox_lease_seconds),
+                attempts=OutboxEvent.attempts + 1
+            ).returning(
+                OutboxEvent.id, OutboxEvent.topic, OutboxEvent.payload, OutboxEvent.attempts
+            ).execution_options(synchronize_session=False)
+        )).all()
+        await db.commit()
+    return sorted(events, key=lambda event: event.id)
+
+
+async def deliver_event(topic: str, payload: str) -> str | None:
+    try:
+        for handler in outbox_handlers.get(topic, []):
+            await handler(orjson.loads(payload))
+    except Exception as exc:
+        logger.exception("outbox handler failed for %s", topic)
+        return repr(exc)
+    return None
+
+
+async def process_outbox_batch(limit: int | None = None) -> int:
+    events = await claim_events(limit or settings.outbox_batch_size)
+    if not events:
+        return 0
+
+    delivered, failures = [], []
+    for event in events:
+        error = await deliver_event(event.topic, event.payload)
+        if error is None:
+            delivered.append(event.id)
+        else:
+            failures.append((event, error))
+
+    now = datetime.utcnow()
+    async with outbox_write_lock(), AsyncSessionLocal() as db:
+        if delivered:
+            await db.execute(delete(OutboxEvent).filter(OutboxEvent.id.in_(delivered)))
+        for event, error in failures:
+            if event.attempts >= settings.outbox_max_attempts:
+                values = {"failed_at": now, "last_error": error}
+                outbox_stats.failed += 1
+            else:
+                values = {"available_at": now + timedelta(seconds=backoff_seconds(event.attempts)), "last_error": error}
+                outbox_stats.retried += 1
+            await db.execute(update(OutboxEvent).filter(OutboxEvent.id == event.id).values(**values))
+        await db.commit()
+
+    outbox_stats.delivered += len(delivered)
+    return len(events)
+
+
+class OutboxWorkerPool:
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.tasks: list[asyncio.Task] = []
+        self.wakeup = asyncio.Event()
+        self.stopping = False
+
+    def start(self):
+        self.tasks = [asyncio.create_task(self.run()) for _ in range(self.workers)]
+
+    def notify(self):
+        self.wakeup.set()
+
+    async def run(self):
+        while not self.stopping:
+            try:
+                claimed = await process_outbox_batch()
+            except Exception:
+                logger.exception("outbox batch failed")
+                claimed = 0
+            if claimed < settings.outbox_batch_size and not self.stopping:
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), settings.outbox_poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                self.wakeup.clear()
+
+    async def stop(self, timeout: float = 10.0):
+        self.stopping = True
+        self.wakeup.set()
+        if not self.tasks:
+            return
+        _, pending = await asyncio.wait(self.tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+outbox_pool: OutboxWorkerPool | None = None
+
+
+def start_outbox_workers(workers: int) -> OutboxWorkerPool:
+    global outbox_pool
+    outbox_pool = OutboxWorkerPool(workers)
+    outbox_pool.start()
+    return outbox_pool
+
+
+async def stop_outbox_workers():
+    global outbox_pool
+    if outbox_pool is not None:
+        await outbox_pool.stop()
+        outbox_pool = None
+
+
+def notify_outbox():
+    if outbox_pool is not None:
+        outbox_pool.notify()
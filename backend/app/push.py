@@ -0,0 +1,166 @@
+import asyncio
+import signal
+import threading
+from typing import Callable
+
+import orjson
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.order import OrderStatus
+from app.orders import load_order, get_order_response
+from app.outbox import outbox_handler
+
+PUSH_CHANNEL = "slooze:order-events"
+
+
+class PushSubscriber:
+    def __init__(self, accepts: Callable[[dict], bool]):
+        self.accepts = accepts
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=settings.push_queue_size)
+        self.overflowed = False
+        self.closed = False
+
+    def close(self):
+        # A stream with a full queue is not waiting on get(); it sees closed
+        # on its next pass instead of draining the backlog first.
+        self.closed = True
+        try:
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+
+
+class PushHub:
+    def __init__(self):
+        self.subscribers: set[PushSubscriber] = set()
+        self.dropped = 0
+        self.closing = False
+
+    def subscribe(self, accepts: Callable[[dict], bool]) -> PushSubscriber | None:
+        if self.closing or len(self.subscribers) >= settings.push_max_subscribers:
+            return None
+        subscriber = PushSubscriber(accepts)
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: PushSubscriber):
+        self.subscribers.discard(subscriber)
+
+    def dispatch(self, event: dict):
+        for subscriber in list(self.subscribers):
+            if not subscriber.accepts(event):
+                continue
+            try:
+                subscriber.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # A consumer that cannot keep up is cut loose rather than
+                # buffered without bound; it refetches on reconnect.
+                subscriber.overflowed = True
+                self.subscribers.discard(subscriber)
+                self.dropped += 1
+
+    def close(self):
+        self.closing = True
+        for subscriber in list(self.subscribers):
+            subscriber.close()
+
+
+class PushBroker:
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def publish(self, event: dict) -> None:
+        raise NotImplementedError
+
+
+class MemoryPushBroker(PushBroker):
+    def __init__(self, hub: PushHub):
+        self.hub = hub
+
+    async def publish(self, event: dict) -> None:
+        self.hub.dispatch(event)
+
+
+class RedisPushBroker(PushBroker):
+    def __init__(self, url: str, hub: PushHub, channel: str = PUSH_CHANNEL):
+        import redis.asyncio as redis
+
+        self.client = redis.Redis.from_url(url)
+        self.hub = hub
+        self.channel = channel
+        self.listener: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        pubsub = self.client.pubsub()
+        await pubsub.subscribe(self.channel)
+        self.listener = asyncio.create_task(self.listen(pubsub))
+
+    async def listen(self, pubsub):
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    self.hub.dispatch(orjson.loads(message["data"]))
+        finally:
+            await pubsub.aclose()
+
+    async def stop(self) -> None:
+        if self.listener is not None:
+            self.listener.cancel()
+            await asyncio.gather(self.listener, return_exceptions=True)
+            self.listener = None
+        await self.client.aclose()
+
+    async def publish(self, event: dict) -> None:
+        await self.client.publish(self.channel, orjson.dumps(event))
+
+
+def create_push_broker(url: str, hub: PushHub) -> PushBroker:
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisPushBroker(url, hub)
+    return MemoryPushBroker(hub)
+
+
+push_hub = PushHub()
+push_broker = create_push_broker(settings.push_broker_url, push_hub)
+
+
+def close_streams_on_shutdown_signals():
+    # The server waits for open responses before running lifespan shutdown,
+    # so event streams are ended as soon as the stop signal arrives instead.
+    if threading.current_thread() is not threading.main_thread():
+        return
+    loop = asyncio.get_running_loop()
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        previous = signal.getsignal(signum)
+
+        def handler(received, frame, previous=previous):
+            loop.call_soon_threadsafe(push_hub.close)
+            if callable(previous):
+                previous(received, frame)
+            else:
+                signal.signal(received, previous or signal.SIG_DFL)
+                signal.raise_signal(received)
+
+        signal.signal(signum, handler)
+
+
+@outbox_handler("order.placed", "order.cancelled")
+async def push_order_update(payload: dict):
+    async with AsyncSessionLocal() as db:
+        order = await load_order(db, payload["order_id"])
+
+    # The order may have moved on since the event was written; report the
+    # transition this event describes, tagged with its version.
+    response = get_order_response(order).model_copy(update={"status": OrderStatus(payload["status"])})
+    await push_broker.publish({
+        "type": f"order.{payload['status']}",
+        "user_id": payload["user_id"],
+        "country": payload["country"],
+        "version": payload["version"],
+        "order": response.model_dump(mode="json")
+    })
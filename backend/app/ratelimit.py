@@ -0,0 +1,133 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from fastapi import Depends, HTTPException, Request, status
+
+from app.auth.dependencies import CurrentUser, get_current_user
+from app.config import settings
+
+RATE_LIMIT_PERIODS = {"second": 1, "minute": 60, "hour": 3600}
+
+REDIS_TOKEN_BUCKET = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'at')
+local tokens = tonumber(state[1]) or burst
+local at = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + (now - at) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'at', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000))
+return tostring(wait)
+"""
+
+
+class RateLimiter:
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryRateLimiter(RateLimiter):
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, at = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - at) * rate)
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / rate
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+
+class RedisRateLimiter(RateLimiter):
+    def __init__(self, url: str, prefix: str = "slooze:"):
+        import redis.asyncio as redis
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self.script = self.client.register_script(REDIS_TOKEN_BUCKET)
+
+    async def take(self, key: str, rate: float, burst: int) -> float:
+        return float(await self.script(keys=[self.prefix + key], args=[rate, burst]))
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+def create_rate_limiter(url: str, max_keys: int = 100000) -> RateLimiter:
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisRateLimiter(url)
+    return MemoryRateLimiter(max_keys)
+
+
+rate_limiter = create_rate_limiter(settings.rate_limit_url, settings.rate_limit_max_keys)
+
+
+class RateLimitStats:
+    def __init__(self):
+        self.rejected = 0
+
+
+rate_limit_stats = RateLimitStats()
+
+
+@lru_cache
+def parse_rate_limit(spec: str) -> tuple[float, int]:
+    count, period = spec.split("/")
+    return int(count) / RATE_LIMIT_PERIODS[period.strip()], int(count)
+
+
+async def enforce_rate_limit(request: Request, subject: str):
+    if not settings.rate_limit_enabled:
+        return
+    route = request.scope.get("route")
+    route_name = route.name if route is not None else request.url.path
+    spec = settings.rate_limits.get(route_name, settings.rate_limit_default)
+    if not spec:
+        return
+
+    rate, burst = parse_rate_limit(spec)
+    wait = await rate_limiter.take(f"ratelimit:{route_name}:{subject}", rate, burst)
+    if wait > 0:
+        rate_limit_stats.rejected += 1
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests",
+            headers={"Retry-After": str(math.ceil(wait))}
+        )
+
+
+def client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
+async def rate_limit_by_ip(request: Request):
+    await enforce_rate_limit(request, f"ip:{client_ip(request)}")
+
+
+async def rate_limit_by_user(request: Request, current_user: CurrentUser = Depends(get_current_user)):
+    await enforce_rate_limit(request, f"user:{current_user.id}")
@@ -0,0 +1,28 @@
+from fastapi import Depends, Request
+
+from app.auth.dependencies import CurrentUser, get_current_user
+from app.cache import create_cache
+from app.config import settings
+from app.database import AsyncSessionLocal, ReadSessionLocal
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+primary_pins = create_cache(settings.cache_url, settings.auth_cache_max_entries)
+
+
+def primary_pin_key(user_id: int) -> str:
+    return f"replica:pin:{user_id}"
+
+
+async def pin_writers_to_primary(request: Request, current_user: CurrentUser = Depends(get_current_user)):
+    if settings.database_replica_url and request.method not in SAFE_METHODS:
+        await primary_pins.set(primary_pin_key(current_user.id), 1, settings.database_replica_pin_seconds)
+
+
+async def get_read_db(current_user: CurrentUser = Depends(get_current_user)):
+    if not settings.database_replica_url or await primary_pins.get(primary_pin_key(current_user.id)) is not None:
+        session = AsyncSessionLocal()
+    else:
+        session = ReadSessionLocal()
+    async with session as db:
+        yield db
@@ -0,0 +1,135 @@
+from datetime import date
+
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import is_sqlite
+from app.models.order import Order, OrderItem, OrderStatus
+from app.models.report import CountrySalesDaily, MenuItemSalesDaily, RestaurantSalesDaily
+from app.models.restaurant import MenuItem
+
+
+def upsert_counters(model, keys: list[str], counters: list[str]):
+    statement = (sqlite.insert if is_sqlite else postgresql.insert)(model.__table__)
+    return statement.on_conflict_do_update(
+        index_elements=keys,
+        set_={name: model.__table__.c[name] + statement.excluded[name] for name in counters}
+    )
+
+
+def order_sales_day(order: Order) -> date:
+    return (order.placed_at or order.created_at).date()
+
+
+async def record_order_sales(db: AsyncSession, order: Order, day: date, cancelled: bool = False):
+    sign = -1 if cancelled else 1
+    placed, cancelled_count = (0, 1) if cancelled else (1, 0)
+
+    lines = (await db.execute(
+        select(
+            MenuItem.restaurant_id,
+            OrderItem.menu_item_id,
+            OrderItem.quantity,
+            OrderItem.price_minor
+        ).join(MenuItem, MenuItem.id == OrderItem.menu_item_id).filter(OrderItem.order_id == order.id)
+    )).all()
+
+    restaurant_rows = {}
+    menu_item_rows = []
+    for restaurant_id, menu_item_id, quantity, price_minor in lines:
+        row = restaurant_rows.setdefault(restaurant_id, {
+            "day": day,
+            "country": order.country,
+            "restaurant_id": restaurant_id,
+            "orders_placed": placed,
+            "orders_cancelled": cancelled_count,
+            "revenue_minor": 0,
+            "items_sold": 0
+        })
+        row["revenue_minor"] += sign * quantity * price_minor
+        row["items_sold"] += sign * quantity
+        menu_item_rows.append({
+            "day": day,
+            "country": order.country,
+            "menu_item_id": menu_item_id,
+            "restaurant_id": restaurant_id,
+            "quantity": sign * quantity,
+            "revenue_minor": sign * quantity * price_minor
+        })
+
+    await db.execute(
+        upsert_counters(CountrySalesDaily, ["day", "country"], ["orders_placed", "orders_cancelled", "revenue_minor"]),
+        [{
+            "day": day,
+            "country": order.country,
+            "orders_placed": placed,
+            "orders_cancelled": cancelled_count,
+            "revenue_minor": sign * order.total_minor
+        }]
+    )
+    if restaurant_rows:
+        await db.execute(
+            upsert_counters(
+                RestaurantSalesDaily,
+                ["day", "country", "restaurant_id"],
+                ["orders_placed", "orders_cancelled", "revenue_minor", "items_sold"]
+            ),
+            list(restaurant_rows.values())
+        )
+        await db.execute(
+            upsert_counters(MenuItemSalesDaily, ["day", "country", "menu_item_id"], ["quantity", "revenue_minor"]),
+            menu_item_rows
+        )
+
+
+def rebuild_sales_reports(conn):
+    day = func.date(func.coalesce(Order.placed_at, Order.created_at))
+    is_cancelled = Order.status == OrderStatus.CANCELLED
+    line_revenue = OrderItem.quantity * OrderItem.price_minor
+
+    def live(value):
+        return func.coalesce(func.sum(case((is_cancelled, 0), else_=value)), 0)
+
+    for model in (MenuItemSalesDaily, RestaurantSalesDaily, CountrySalesDaily):
+        conn.execute(delete(model))
+
+    conn.execute(insert(CountrySalesDaily).from_select(
+        ["day", "country", "orders_placed", "orders_cancelled", "revenue_minor"],
+        select(
+            day,
+            Order.country,
+            func.count(),
+            func.sum(case((is_cancelled, 1), else_=0)),
+            live(Order.total_minor)
+        ).filter(Order.status != OrderStatus.CART).group_by(day, Order.country)
+    ))
+
+    order_lines = select().select_from(OrderItem).join(Order, Order.id == OrderItem.order_id).join(
+        MenuItem, MenuItem.id == OrderItem.menu_item_id
+    ).filter(Order.status != OrderStatus.CART)
+
+    conn.execute(insert(RestaurantSalesDaily).from_select(
+        ["day", "country", "restaurant_id", "orders_placed", "orders_cancelled", "revenue_minor", "items_sold"],
+        order_lines.add_columns(
+            day,
+            Order.country,
+            MenuItem.restaurant_id,
+            func.count(func.distinct(Order.id)),
+            func.count(func.distinct(case((is_cancelled, Order.id)))),
+            live(line_revenue),
+            live(OrderItem.quantity)
+        ).group_by(day, Order.country, MenuItem.restaurant_id)
+    ))
+
+    conn.execute(insert(MenuItemSalesDaily).from_select(
+        ["day", "country", "menu_item_id", "restaurant_id", "quantity", "revenue_minor"],
+        order_lines.add_columns(
+            day,
+            Order.country,
+            OrderItem.menu_item_id,
+            MenuItem.restaurant_id,
+            live(OrderItem.quantity),
+            live(line_revenue)
+        ).group_by(day, Order.country, OrderItem.menu_item_id, MenuItem.restaurant_id)
+    ))
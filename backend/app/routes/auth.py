@@ -1,30 +1,54 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.user import User
-from app.auth.password import verify_password
+from app.auth.password import (
+    PasswordPoolBusy,
+    hash_password_async,
+    password_needs_rehash,
+    verify_password_async,
+)
 from app.auth.jwt import create_access_token
-from app.auth.dependencies import get_current_user
+from app.auth.dependencies import CurrentUser, get_current_user
 from app.schemas.auth import LoginRequest, TokenResponse, UserResponse
 
 router = APIRouter()
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(request: LoginRequest, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == request.email).first()
+async def login(request: LoginRequest, db: AsyncSession = Depends(get_db)):
+    user = await db.scalar(select(User).filter(User.email == request.email))
     
-    if not user or not verify_password(request.password, user.password):
+    try:
+        valid = user is not None and await verify_password_async(request.password, user.password)
+    except PasswordPoolBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress",
+            headers={"Retry-After": "1"}
+        )
+    
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
     
+    if password_needs_rehash(user.password):
+        # Best effort: the password is already verified, so a busy pool only
+        # postpones the upgrade to a later login.
+        try:
+            user.password = await hash_password_async(request.password)
+            await db.commit()
+        except PasswordPoolBusy:
+            pass
+    
     access_token = create_access_token(data={"sub": str(user.id)})
     return TokenResponse(access_token=access_token)
 
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_profile(current_user: User = Depends(get_current_user)):
+async def get_current_user_profile(current_user: CurrentUser = Depends(get_current_user)):
     return current_user
@@ -0,0 +1,92 @@
+import asyncio
+import time
+from datetime import timedelta
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+import orjson
+
+from app.config import settings
+from app.models.user import UserRole, Country
+from app.push import push_hub
+from app.ratelimit import enforce_rate_limit
+from app.auth.dependencies import CurrentUser, get_current_user, get_stream_user, get_country_filter
+from app.auth.jwt import STREAM_TOKEN_SCOPE, create_access_token
+from app.schemas.auth import StreamTokenResponse
+
+router = APIRouter()
+
+SSE_RETRY_MS = 3000
+
+
+def order_event_filter(current_user: CurrentUser, country: Country | None):
+    country_filter = get_country_filter(current_user)
+
+    def accepts(event: dict) -> bool:
+        if current_user.role != UserRole.ADMIN and event["user_id"] != current_user.id:
+            return False
+        if country_filter and event["country"] != country_filter.value:
+            return False
+        return not country or event["country"] == country.value
+
+    return accepts
+
+
+def sse_message(event: dict) -> str:
+    data = orjson.dumps({"type": event["type"], "version": event["version"], "order": event["order"]}).decode()
+    return f"event: order\nid: {event['order']['id']}:{event['version']}\ndata: {data}\n\n"
+
+
+async def order_event_stream(request: Request, subscriber):
+    deadline = time.monotonic() + settings.push_stream_max_seconds
+    try:
+        yield f"retry: {SSE_RETRY_MS}\n\n"
+        while time.monotonic() < deadline and not subscriber.overflowed and not subscriber.closed:
+            try:
+                event = await asyncio.wait_for(subscriber.queue.get(), settings.push_heartbeat_seconds)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    return
+                yield ": keepalive\n\n"
+                continue
+            if event is None:
+                return
+            yield sse_message(event)
+        if subscriber.overflowed:
+            yield "event: reset\ndata: {}\n\n"
+    finally:
+        push_hub.unsubscribe(subscriber)
+
+
+@router.post("/token", response_model=StreamTokenResponse)
+async def create_stream_token(request: Request, current_user: CurrentUser = Depends(get_current_user)):
+    await enforce_rate_limit(request, f"user:{current_user.id}")
+    
+    stream_token = create_access_token(
+        data={"sub": str(current_user.id), "scope": STREAM_TOKEN_SCOPE},
+        expires_delta=timedelta(seconds=settings.stream_token_expire_seconds)
+    )
+    return StreamTokenResponse(stream_token=stream_token, expires_in=settings.stream_token_expire_seconds)
+
+
+@router.get("/orders")
+async def order_events(
+    request: Request,
+    country: Optional[Country] = None,
+    current_user: CurrentUser = Depends(get_stream_user)
+):
+    await enforce_rate_limit(request, f"user:{current_user.id}")
+
+    subscriber = push_hub.subscribe(order_event_filter(current_user, country))
+    if subscriber is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many open event streams, please retry",
+            headers={"Retry-After": str(settings.load_shed_retry_after_seconds)}
+        )
+
+    return StreamingResponse(
+        order_event_stream(request, subscriber),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,46 +1,178 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import base64
+import csv
+import io
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import and_, or_, select, insert, update, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
 
-from app.database import get_db
-from app.models.user import User, UserRole
+from app.database import get_db, serialized_writes, AsyncSessionLocal
+from app.models.user import UserRole, Country
 from app.models.restaurant import MenuItem
 from app.models.order import Order, OrderItem, OrderStatus
-from app.auth.dependencies import get_current_user, require_roles, get_country_filter
-from app.schemas.order import AddToCartRequest, OrderResponse, OrderItemResponse, CheckoutRequest
+from app.money import to_minor, to_major
+from app.orders import order_query, load_order, get_order_response
+from app.etag import make_etag, etag_matches, not_modified
+from app.idempotency import claim_idempotency_key
+from app.replicas import get_read_db
+from app.reports import order_sales_day, record_order_sales
+from app.outbox import enqueue_order_event, notify_outbox
+from app.auth.dependencies import CurrentUser, get_current_user, require_roles, get_country_filter
+from app.schemas.order import AddToCartRequest, BulkCartRequest, OrderResponse, CheckoutRequest
 
 router = APIRouter()
 
+EXPORT_BATCH_SIZE = 1000
+EXPORT_CSV_COLUMNS = [
+    "order_id", "user_id", "status", "country", "total_amount", "created_at",
+    "item_id", "menu_item_id", "menu_item_name", "quantity", "price",
+]
 
-def get_order_response(order: Order) -> OrderResponse:
-    items = []
-    for item in order.items:
-        items.append(OrderItemResponse(
-            id=item.id,
-            menu_item_id=item.menu_item_id,
-            menu_item_name=item.menu_item.name,
-            quantity=item.quantity,
-            price=item.price
+
+async def get_or_create_cart_id(db: AsyncSession, current_user: CurrentUser) -> int:
+    cart_id = await db.scalar(select(Order.id).filter(
+        Order.user_id == current_user.id,
+        Order.status == OrderStatus.CART
+    ))
+    if cart_id:
+        return cart_id
+    
+    cart = Order(
+        user_id=current_user.id,
+        status=OrderStatus.CART,
+        country=current_user.country
+    )
+    db.add(cart)
+    try:
+        await db.flush()
+    except IntegrityError:
+        await db.rollback()
+        return await db.scalar(select(Order.id).filter(
+            Order.user_id == current_user.id,
+            Order.status == OrderStatus.CART
         ))
-    return OrderResponse(
-        id=order.id,
-        status=order.status,
-        total_amount=order.total_amount,
-        country=order.country,
-        created_at=order.created_at,
-        items=items
+    return cart.id
+
+
+async def update_cart_total(db: AsyncSession, cart_id: int, total_minor, version: int | None = None):
+    filters = [Order.id == cart_id, Order.status == OrderStatus.CART]
+    if version is not None:
+        filters.append(Order.version == version)
+    updated = await db.execute(
+        update(Order).filter(*filters).values(
+            total_minor=total_minor,
+            version=Order.version + 1,
+            updated_at=datetime.utcnow()
+        )
+    )
+    if updated.rowcount != 1:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Cart was checked out by another request" if version is None else "Cart changed during update, please retry"
+        )
+
+
+async def adjust_cart_total(db: AsyncSession, cart_id: int, delta_minor: int):
+    await update_cart_total(db, cart_id, Order.total_minor + delta_minor)
+
+
+async def read_cart_lines(db: AsyncSession, cart_id: int) -> tuple[int, dict]:
+    # The version is read first: a write committed between the two reads
+    # leaves it stale, which only makes the later compare-and-swap miss.
+    version = await db.scalar(select(Order.version).filter(Order.id == cart_id))
+    lines = {
+        row.menu_item_id: row
+        for row in (await db.execute(
+            select(OrderItem.id, OrderItem.menu_item_id, OrderItem.quantity, OrderItem.price_minor).filter(
+                OrderItem.order_id == cart_id
+            )
+        )).all()
+    }
+    return version, lines
+
+
+def cart_etag(cart) -> str:
+    return make_etag("order", cart.id, cart.version)
+
+
+def encode_cursor(order) -> str:
+    raw = f"{order.created_at.isoformat()}|{order.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        created_at, order_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(order_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+async def order_list_payload(db: AsyncSession, rows) -> list[dict]:
+    payload = []
+    items_by_order = {}
+    for row in rows:
+        items = items_by_order[row.id] = []
+        payload.append({
+            "id": row.id,
+            "status": row.status.value,
+            "total_amount": to_major(row.total_minor),
+            "country": row.country.value,
+            "created_at": row.created_at,
+            "items": items
+        })
+    
+    item_rows = await db.execute(
+        select(
+            OrderItem.order_id,
+            OrderItem.id,
+            OrderItem.menu_item_id,
+            MenuItem.name,
+            OrderItem.quantity,
+            OrderItem.price_minor
+        ).join(MenuItem, MenuItem.id == OrderItem.menu_item_id).filter(
+            OrderItem.order_id.in_(items_by_order)
+        ).order_by(OrderItem.order_id, OrderItem.id)
     )
+    for order_id, item_id, menu_item_id, menu_item_name, quantity, price_minor in item_rows:
+        items_by_order[order_id].append({
+            "id": item_id,
+            "menu_item_id": menu_item_id,
+            "menu_item_name": menu_item_name,
+            "quantity": quantity,
+            "price": to_major(price_minor)
+        })
+    return payload
 
 
 @router.get("/cart", response_model=OrderResponse)
-def get_cart(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+async def get_cart(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
-    cart = db.query(Order).filter(
+    version = (await db.execute(select(Order.id, Order.version).filter(
         Order.user_id == current_user.id,
         Order.status == OrderStatus.CART
-    ).first()
+    ))).first()
+    
+    if version:
+        headers = {"ETag": cart_etag(version), "Cache-Control": "private, no-cache"}
+        if etag_matches(request, headers["ETag"]):
+            return not_modified(headers)
+    
+    cart = await db.scalar(order_query().filter(
+        Order.user_id == current_user.id,
+        Order.status == OrderStatus.CART
+    ))
     
     if not cart:
         cart = Order(
@@ -49,109 +181,178 @@ def get_cart(
             country=current_user.country
         )
         db.add(cart)
-        db.commit()
-        db.refresh(cart)
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+        cart = await db.scalar(order_query().filter(
+            Order.user_id == current_user.id,
+            Order.status == OrderStatus.CART
+        ))
     
+    response.headers["ETag"] = cart_etag(cart)
+    response.headers["Cache-Control"] = "private, no-cache"
     return get_order_response(cart)
 
 
-@router.post("/cart/items", response_model=OrderResponse)
-def add_to_cart(
+@router.post("/cart/items", response_model=OrderResponse, dependencies=[Depends(serialized_writes)])
+async def add_to_cart(
     request: AddToCartRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
-    menu_item = db.query(MenuItem).filter(MenuItem.id == request.menu_item_id).first()
-    if not menu_item:
+    menu_price = await db.scalar(select(MenuItem.price).filter(MenuItem.id == request.menu_item_id))
+    if menu_price is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Menu item not found"
         )
     
-    cart = db.query(Order).filter(
-        Order.user_id == current_user.id,
-        Order.status == OrderStatus.CART
-    ).first()
+    cart_id = await get_or_create_cart_id(db, current_user)
     
-    if not cart:
-        cart = Order(
-            user_id=current_user.id,
-            status=OrderStatus.CART,
-            country=current_user.country
-        )
-        db.add(cart)
-        db.commit()
-        db.refresh(cart)
-    
-    existing_item = db.query(OrderItem).filter(
-        OrderItem.order_id == cart.id,
-        OrderItem.menu_item_id == request.menu_item_id
-    ).first()
-    
-    if existing_item:
-        existing_item.quantity += request.quantity
-    else:
-        order_item = OrderItem(
-            order_id=cart.id,
+    price_minor = await db.scalar(
+        update(OrderItem).filter(
+            OrderItem.order_id == cart_id,
+            OrderItem.menu_item_id == request.menu_item_id
+        ).values(quantity=OrderItem.quantity + request.quantity).returning(OrderItem.price_minor)
+    )
+    
+    if price_minor is None:
+        price_minor = to_minor(menu_price)
+        await db.execute(insert(OrderItem).values(
+            order_id=cart_id,
             menu_item_id=request.menu_item_id,
             quantity=request.quantity,
-            price=menu_item.price
+            price_minor=price_minor
+        ))
+    
+    await adjust_cart_total(db, cart_id, price_minor * request.quantity)
+    await db.commit()
+    cart = await load_order(db, cart_id)
+    
+    return get_order_response(cart)
+
+
+@router.post("/cart/items/batch", response_model=OrderResponse, dependencies=[Depends(serialized_writes)])
+async def update_cart_items(
+    request: BulkCartRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    menu_item_ids = {operation.menu_item_id for operation in request.operations}
+    menu_prices = dict((await db.execute(
+        select(MenuItem.id, MenuItem.price).filter(MenuItem.id.in_(menu_item_ids))
+    )).all())
+    
+    missing = sorted(menu_item_ids - menu_prices.keys())
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Menu items not found: {', '.join(map(str, missing))}"
         )
-        db.add(order_item)
     
-    cart.total_amount = sum(item.price * item.quantity for item in cart.items)
-    db.commit()
-    db.refresh(cart)
+    cart_id = await get_or_create_cart_id(db, current_user)
+    version, lines = await read_cart_lines(db, cart_id)
+    quantities = {menu_item_id: line.quantity for menu_item_id, line in lines.items()}
+    
+    for operation in request.operations:
+        current = quantities.get(operation.menu_item_id, 0)
+        if operation.op == "add":
+            quantities[operation.menu_item_id] = current + operation.quantity
+        elif operation.op == "set":
+            quantities[operation.menu_item_id] = operation.quantity
+        else:
+            quantities[operation.menu_item_id] = 0
+    
+    removed_ids = [
+        line.id for menu_item_id, line in lines.items() if quantities[menu_item_id] <= 0
+    ]
+    updated = [
+        {"id": line.id, "quantity": quantities[menu_item_id]}
+        for menu_item_id, line in lines.items()
+        if 0 < quantities[menu_item_id] != line.quantity
+    ]
+    inserted = [
+        {
+            "order_id": cart_id,
+            "menu_item_id": menu_item_id,
+            "quantity": quantity,
+            "price_minor": to_minor(menu_prices[menu_item_id])
+        }
+        for menu_item_id, quantity in quantities.items()
+        if menu_item_id not in lines and quantity > 0
+    ]
+    
+    try:
+        if removed_ids:
+            await db.execute(delete(OrderItem).filter(OrderItem.id.in_(removed_ids)))
+        if updated:
+            await db.execute(update(OrderItem), updated)
+        if inserted:
+            await db.execute(insert(OrderItem), inserted)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Cart changed during update, please retry"
+        )
+    
+    total_minor = sum(
+        line.price_minor * quantities[menu_item_id]
+        for menu_item_id, line in lines.items() if quantities[menu_item_id] > 0
+    ) + sum(line["price_minor"] * line["quantity"] for line in inserted)
+    # The quantities above are absolute, computed from the lines read with
+    # this version; any other cart write since then bumped it, so the swap
+    # misses and the whole batch is rolled back instead of overwriting it.
+    await update_cart_total(db, cart_id, total_minor, version)
+    await db.commit()
+    cart = await load_order(db, cart_id)
     
     return get_order_response(cart)
 
 
-@router.delete("/cart/items/{item_id}", response_model=OrderResponse)
-def remove_from_cart(
+@router.delete("/cart/items/{item_id}", response_model=OrderResponse, dependencies=[Depends(serialized_writes)])
+async def remove_from_cart(
     item_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
-    cart = db.query(Order).filter(
+    cart_id = await db.scalar(select(Order.id).filter(
         Order.user_id == current_user.id,
         Order.status == OrderStatus.CART
-    ).first()
+    ))
     
-    if not cart:
+    if not cart_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Cart not found"
         )
     
-    order_item = db.query(OrderItem).filter(
-        OrderItem.id == item_id,
-        OrderItem.order_id == cart.id
-    ).first()
+    removed = (await db.execute(
+        delete(OrderItem).filter(
+            OrderItem.id == item_id,
+            OrderItem.order_id == cart_id
+        ).returning(OrderItem.price_minor, OrderItem.quantity)
+    )).first()
     
-    if not order_item:
+    if not removed:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Item not found in cart"
         )
     
-    db.delete(order_item)
-    cart.total_amount = sum(item.price * item.quantity for item in cart.items if item.id != item_id)
-    db.commit()
-    db.refresh(cart)
+    await adjust_cart_total(db, cart_id, -removed.price_minor * removed.quantity)
+    await db.commit()
+    cart = await load_order(db, cart_id)
     
     return get_order_response(cart)
 
 
-@router.post("/checkout", response_model=OrderResponse)
-def checkout(
-    request: CheckoutRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER]))
-):
-    cart = db.query(Order).filter(
+async def place_order(db: AsyncSession, current_user: CurrentUser, if_match: str | None) -> OrderResponse:
+    cart = await db.scalar(order_query().filter(
         Order.user_id == current_user.id,
         Order.status == OrderStatus.CART
-    ).first()
+    ))
     
     if not cart or not cart.items:
         raise HTTPException(
@@ -159,19 +360,77 @@ def checkout(
             detail="Cart is empty"
         )
     
-    cart.status = OrderStatus.PLACED
-    db.commit()
-    db.refresh(cart)
+    if if_match and if_match.strip() not in ("*", cart_etag(cart)):
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Cart changed since it was read"
+        )
+    
+    placed_at = datetime.utcnow()
+    placed = await db.execute(
+        update(Order).filter(Order.id == cart.id, Order.version == cart.version).values(
+            status=OrderStatus.PLACED,
+            version=Order.version + 1,
+            updated_at=placed_at,
+            placed_at=placed_at
+        )
+    )
+    if placed.rowcount != 1:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Cart changed during checkout, please retry"
+        )
+    
+    await record_order_sales(db, cart, placed_at.date())
+    enqueue_order_event(db, cart, OrderStatus.PLACED, cart.version + 1)
+    await db.commit()
+    notify_outbox()
+    cart = await load_order(db, cart.id)
     
     return get_order_response(cart)
 
 
+@router.post("/checkout", response_model=OrderResponse, dependencies=[Depends(serialized_writes)])
+async def checkout(
+    request: CheckoutRequest,
+    idempotency_key: Optional[str] = Header(None, min_length=1, max_length=255),
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER]))
+):
+    claim = await claim_idempotency_key("checkout", current_user.id, idempotency_key, request)
+    if claim.replay is not None:
+        return claim.replay
+    
+    try:
+        order = await place_order(db, current_user, if_match)
+    except Exception:
+        await claim.release()
+        raise
+    
+    return await claim.complete(order)
+
+
 @router.get("", response_model=List[OrderResponse])
-def list_orders(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+async def list_orders(
+    request: Request,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    order_status: Optional[OrderStatus] = Query(None, alias="status"),
+    country: Optional[Country] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
-    query = db.query(Order).filter(Order.status != OrderStatus.CART)
+    query = select(
+        Order.id,
+        Order.status,
+        Order.total_minor,
+        Order.country,
+        Order.created_at,
+        Order.updated_at
+    ).filter(Order.status != OrderStatus.CART)
     
     if current_user.role != UserRole.ADMIN:
         country_filter = get_country_filter(current_user)
@@ -179,17 +438,143 @@ def list_orders(
             query = query.filter(Order.country == country_filter)
         query = query.filter(Order.user_id == current_user.id)
     
-    orders = query.order_by(Order.created_at.desc()).all()
-    return [get_order_response(order) for order in orders]
+    if order_status:
+        query = query.filter(Order.status == order_status)
+    if country:
+        query = query.filter(Order.country == country)
+    if created_from:
+        query = query.filter(Order.created_at >= created_from)
+    if created_to:
+        query = query.filter(Order.created_at < created_to)
+    
+    if cursor:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            Order.created_at < cursor_created_at,
+            and_(Order.created_at == cursor_created_at, Order.id < cursor_id)
+        ))
+    
+    newest_first = (Order.created_at.desc(), Order.id.desc())
+    rows = (await db.execute(query.order_by(*newest_first).limit(limit + 1))).all()
+    
+    headers = {"Cache-Control": "private, no-cache"}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = encode_cursor(rows[-1])
+    headers["ETag"] = make_etag("orders", *((row.id, row.updated_at) for row in rows))
+    
+    if etag_matches(request, headers["ETag"]):
+        return not_modified(headers)
+    
+    payload = await order_list_payload(db, rows) if rows else []
+    return ORJSONResponse(payload, headers=headers)
+
+
+async def export_rows(country_filter: Country | None):
+    query = select(
+        Order.id,
+        Order.user_id,
+        Order.status,
+        Order.country,
+        Order.total_minor,
+        Order.created_at,
+        OrderItem.id,
+        OrderItem.menu_item_id,
+        MenuItem.name,
+        OrderItem.quantity,
+        OrderItem.price_minor
+    ).outerjoin(OrderItem, OrderItem.order_id == Order.id).outerjoin(
+        MenuItem, MenuItem.id == OrderItem.menu_item_id
+    ).filter(Order.status != OrderStatus.CART)
+    
+    if country_filter:
+        query = query.filter(Order.country == country_filter)
+    
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(
+            query.order_by(Order.id, OrderItem.id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        async for row in result:
+            yield (
+                row[0], row[1], row[2].value, row[3].value, to_major(row[4]), row[5].isoformat(),
+                row[6], row[7], row[8], row[9], None if row[10] is None else to_major(row[10])
+            )
+
+
+def export_order_line(order_rows: list) -> bytes:
+    order_id, user_id, order_status, country, total_amount, created_at = order_rows[0][:6]
+    return orjson.dumps({
+        "id": order_id,
+        "user_id": user_id,
+        "status": order_status,
+        "country": country,
+        "total_amount": total_amount,
+        "created_at": created_at,
+        "items": [
+            {
+                "id": row[6],
+                "menu_item_id": row[7],
+                "menu_item_name": row[8],
+                "quantity": row[9],
+                "price": row[10]
+            }
+            for row in order_rows if row[6] is not None
+        ]
+    }) + b"\n"
+
+
+async def export_ndjson(rows):
+    order_rows = []
+    async for row in rows:
+        if order_rows and order_rows[0][0] != row[0]:
+            yield export_order_line(order_rows)
+            order_rows = []
+        order_rows.append(row)
+    if order_rows:
+        yield export_order_line(order_rows)
+
 
+async def export_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_CSV_COLUMNS)
+    async for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= 64 * 1024:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
 
-@router.post("/{order_id}/cancel", response_model=OrderResponse)
-def cancel_order(
+
+@router.get("/export")
+async def export_orders(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    current_user: CurrentUser = Depends(require_roles([UserRole.ADMIN]))
+):
+    rows = export_rows(get_country_filter(current_user))
+    
+    if export_format == "csv":
+        return StreamingResponse(
+            export_csv(rows),
+            media_type="text/csv",
+            headers={"Content-Disposition": "attachment; filename=orders.csv"}
+        )
+    
+    return StreamingResponse(
+        export_ndjson(rows),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": "attachment; filename=orders.ndjson"}
+    )
+
+
+@router.post("/{order_id}/cancel", response_model=OrderResponse, dependencies=[Depends(serialized_writes)])
+async def cancel_order(
     order_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER]))
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER]))
 ):
-    order = db.query(Order).filter(Order.id == order_id).first()
+    order = await db.scalar(select(Order).filter(Order.id == order_id))
     
     if not order:
         raise HTTPException(
@@ -209,8 +594,23 @@ def cancel_order(
             detail="Cannot cancel a cart"
         )
     
-    order.status = OrderStatus.CANCELLED
-    db.commit()
-    db.refresh(order)
+    cancelled = await db.execute(
+        update(Order).filter(Order.id == order.id, Order.version == order.version).values(
+            status=OrderStatus.CANCELLED,
+            version=Order.version + 1,
+            updated_at=datetime.utcnow()
+        )
+    )
+    if cancelled.rowcount != 1:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Order changed while cancelling, please retry"
+        )
+    
+    await record_order_sales(db, order, order_sales_day(order), cancelled=True)
+    enqueue_order_event(db, order, OrderStatus.CANCELLED, order.version + 1)
+    await db.commit()
+    notify_outbox()
+    order = await load_order(db, order.id)
     
     return get_order_response(order)
@@ -1,34 +1,40 @@
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.models.user import User, UserRole
+from app.database import get_db, serialized_writes
+from app.replicas import get_read_db
+from app.models.user import UserRole
 from app.models.payment import PaymentMethod
-from app.auth.dependencies import get_current_user, require_roles
+from app.auth.dependencies import CurrentUser, get_current_user, require_roles
 from app.schemas.payment import PaymentMethodCreate, PaymentMethodUpdate, PaymentMethodResponse
 
 router = APIRouter()
 
 
 @router.get("/methods", response_model=List[PaymentMethodResponse])
-def list_payment_methods(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+async def list_payment_methods(
+    db: AsyncSession = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
-    return db.query(PaymentMethod).filter(PaymentMethod.user_id == current_user.id).all()
+    return (await db.scalars(
+        select(PaymentMethod).filter(PaymentMethod.user_id == current_user.id)
+    )).all()
 
 
-@router.post("/methods", response_model=PaymentMethodResponse)
-def create_payment_method(
+@router.post("/methods", response_model=PaymentMethodResponse, dependencies=[Depends(serialized_writes)])
+async def create_payment_method(
     request: PaymentMethodCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_roles([UserRole.ADMIN]))
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(require_roles([UserRole.ADMIN]))
 ):
     if request.is_default:
-        db.query(PaymentMethod).filter(
-            PaymentMethod.user_id == current_user.id
-        ).update({"is_default": False})
+        await db.execute(
+            update(PaymentMethod).filter(
+                PaymentMethod.user_id == current_user.id
+            ).values(is_default=False)
+        )
     
     payment_method = PaymentMethod(
         user_id=current_user.id,
@@ -37,23 +43,23 @@ def create_payment_method(
         is_default=request.is_default
     )
     db.add(payment_method)
-    db.commit()
-    db.refresh(payment_method)
+    await db.commit()
+    await db.refresh(payment_method)
     
     return payment_method
 
 
-@router.put("/methods/{method_id}", response_model=PaymentMethodResponse)
-def update_payment_method(
+@router.put("/methods/{method_id}", response_model=PaymentMethodResponse, dependencies=[Depends(serialized_writes)])
+async def update_payment_method(
     method_id: int,
     request: PaymentMethodUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_roles([UserRole.ADMIN]))
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(require_roles([UserRole.ADMIN]))
 ):
-    payment_method = db.query(PaymentMethod).filter(
+    payment_method = await db.scalar(select(PaymentMethod).filter(
         PaymentMethod.id == method_id,
         PaymentMethod.user_id == current_user.id
-    ).first()
+    ))
     
     if not payment_method:
         raise HTTPException(
@@ -62,9 +68,11 @@ def update_payment_method(
         )
     
     if request.is_default:
-        db.query(PaymentMethod).filter(
-            PaymentMethod.user_id == current_user.id
-        ).update({"is_default": False})
+        await db.execute(
+            update(PaymentMethod).filter(
+                PaymentMethod.user_id == current_user.id
+            ).values(is_default=False)
+        )
     
     if request.type is not None:
         payment_method.type = request.type
@@ -73,22 +81,22 @@ def update_payment_method(
     if request.is_default is not None:
         payment_method.is_default = request.is_default
     
-    db.commit()
-    db.refresh(payment_method)
+    await db.commit()
+    await db.refresh(payment_method)
     
     return payment_method
 
 
-@router.delete("/methods/{method_id}")
-def delete_payment_method(
+@router.delete("/methods/{method_id}", dependencies=[Depends(serialized_writes)])
+async def delete_payment_method(
     method_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_roles([UserRole.ADMIN]))
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(require_roles([UserRole.ADMIN]))
 ):
-    payment_method = db.query(PaymentMethod).filter(
+    payment_method = await db.scalar(select(PaymentMethod).filter(
         PaymentMethod.id == method_id,
         PaymentMethod.user_id == current_user.id
-    ).first()
+    ))
     
     if not payment_method:
         raise HTTPException(
@@ -96,7 +104,7 @@ def delete_payment_method(
             detail="Payment method not found"
         )
     
-    db.delete(payment_method)
-    db.commit()
+    await db.delete(payment_method)
+    await db.commit()
     
     return {"message": "Payment method deleted"}
@@ -0,0 +1,135 @@
+from datetime import date
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.replicas import get_read_db
+from app.models.user import UserRole, Country
+from app.models.restaurant import Restaurant, MenuItem
+from app.models.report import CountrySalesDaily, RestaurantSalesDaily, MenuItemSalesDaily
+from app.money import to_major
+from app.auth.dependencies import CurrentUser, require_roles, get_country_filter
+from app.schemas.report import SalesSummaryResponse, TopMenuItemResponse
+
+router = APIRouter()
+
+
+def report_filters(model, current_user: CurrentUser, country: Country | None, date_from: date | None, date_to: date | None):
+    filters = []
+    country_filter = get_country_filter(current_user) or country
+    if country_filter:
+        filters.append(model.country == country_filter)
+    if date_from:
+        filters.append(model.day >= date_from)
+    if date_to:
+        filters.append(model.day <= date_to)
+    return filters
+
+
+@router.get("/sales", response_model=List[SalesSummaryResponse])
+async def sales_summary(
+    group_by: str = Query("day", pattern="^(day|country|restaurant)$"),
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    country: Optional[Country] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: CurrentUser = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER]))
+):
+    if group_by == "restaurant":
+        # Rows are split by order country, the same country managers are scoped by,
+        # so a restaurant ordered from several countries gets one row per country.
+        model = RestaurantSalesDaily
+        query = select(
+            RestaurantSalesDaily.restaurant_id,
+            Restaurant.name,
+            RestaurantSalesDaily.country,
+            func.sum(RestaurantSalesDaily.orders_placed),
+            func.sum(RestaurantSalesDaily.orders_cancelled),
+            func.sum(RestaurantSalesDaily.revenue_minor),
+            func.sum(RestaurantSalesDaily.items_sold)
+        ).join(Restaurant, Restaurant.id == RestaurantSalesDaily.restaurant_id).group_by(
+            RestaurantSalesDaily.restaurant_id, Restaurant.name, RestaurantSalesDaily.country
+        ).order_by(
+            func.sum(RestaurantSalesDaily.revenue_minor).desc(),
+            RestaurantSalesDaily.restaurant_id,
+            RestaurantSalesDaily.country
+        )
+    else:
+        model = CountrySalesDaily
+        key = CountrySalesDaily.day if group_by == "day" else CountrySalesDaily.country
+        query = select(
+            key,
+            func.sum(CountrySalesDaily.orders_placed),
+            func.sum(CountrySalesDaily.orders_cancelled),
+            func.sum(CountrySalesDaily.revenue_minor)
+        ).group_by(key).order_by(key)
+    
+    rows = (await db.execute(query.filter(*report_filters(model, current_user, country, date_from, date_to)))).all()
+    
+    if group_by == "restaurant":
+        return [
+            SalesSummaryResponse(
+                restaurant_id=restaurant_id,
+                restaurant_name=name,
+                country=order_country,
+                orders_placed=placed,
+                orders_cancelled=cancelled,
+                revenue=to_major(revenue_minor),
+                items_sold=items_sold
+            )
+            for restaurant_id, name, order_country, placed, cancelled, revenue_minor, items_sold in rows
+        ]
+    
+    return [
+        SalesSummaryResponse(
+            **{group_by: key_value},
+            orders_placed=placed,
+            orders_cancelled=cancelled,
+            revenue=to_major(revenue_minor)
+        )
+        for key_value, placed, cancelled, revenue_minor in rows
+    ]
+
+
+@router.get("/top-items", response_model=List[TopMenuItemResponse])
+async def top_menu_items(
+    limit: int = Query(10, ge=1, le=100),
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    country: Optional[Country] = None,
+    restaurant_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: CurrentUser = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER]))
+):
+    quantity = func.sum(MenuItemSalesDaily.quantity)
+    query = select(
+        MenuItemSalesDaily.menu_item_id,
+        MenuItem.name,
+        MenuItemSalesDaily.restaurant_id,
+        quantity,
+        func.sum(MenuItemSalesDaily.revenue_minor)
+    ).join(MenuItem, MenuItem.id == MenuItemSalesDaily.menu_item_id).filter(
+        *report_filters(MenuItemSalesDaily, current_user, country, date_from, date_to)
+    )
+    
+    if restaurant_id:
+        query = query.filter(MenuItemSalesDaily.restaurant_id == restaurant_id)
+    
+    rows = (await db.execute(
+        query.group_by(MenuItemSalesDaily.menu_item_id, MenuItem.name, MenuItemSalesDaily.restaurant_id)
+        .having(quantity > 0)
+        .order_by(quantity.desc(), MenuItemSalesDaily.menu_item_id)
+        .limit(limit)
+    )).all()
+    
+    return [
+        TopMenuItemResponse(
+            menu_item_id=menu_item_id,
+            menu_item_name=name,
+            restaurant_id=item_restaurant_id,
+            quantity=item_quantity,
+            revenue=to_major(revenue_minor)
+        )
+        for menu_item_id, name, item_restaurant_id, item_quantity, revenue_minor in rows
+    ]
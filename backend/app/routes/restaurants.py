@@ -1,48 +1,80 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.models.user import User
-from app.models.restaurant import Restaurant, MenuItem
-from app.auth.dependencies import get_current_user, get_country_filter
-from app.schemas.restaurant import RestaurantResponse, RestaurantDetailResponse
+from app.config import settings
+from app.replicas import get_read_db
+from app.catalog import catalog_version, get_restaurant_list_json, get_restaurant_detail_json, get_search_json
+from app.etag import etag_matches, not_modified
+from app.auth.dependencies import CurrentUser, get_current_user, get_country_filter
+from app.schemas.restaurant import RestaurantResponse, RestaurantDetailResponse, SearchResult
 
 router = APIRouter()
 
 
+def catalog_headers(etag: str) -> dict:
+    return {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={settings.catalog_http_max_age_seconds}",
+        "Vary": "Authorization",
+    }
+
+
 @router.get("", response_model=List[RestaurantResponse])
-def list_restaurants(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+async def list_restaurants(
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     country_filter = get_country_filter(current_user)
-    query = db.query(Restaurant)
+    restaurants = await get_restaurant_list_json(db, country_filter, await catalog_version(db))
+    headers = catalog_headers(restaurants["etag"])
     
-    if country_filter:
-        query = query.filter(Restaurant.country == country_filter)
+    if etag_matches(request, headers["ETag"]):
+        return not_modified(headers)
     
-    return query.all()
+    return Response(content=restaurants["body"], media_type="application/json", headers=headers)
 
 
-@router.get("/{restaurant_id}", response_model=RestaurantDetailResponse)
-def get_restaurant(
-    restaurant_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+@router.get("/search", response_model=List[SearchResult])
+async def search_restaurants(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=50),
+    offset: int = Query(0, ge=0, le=1000),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     country_filter = get_country_filter(current_user)
-    query = db.query(Restaurant).filter(Restaurant.id == restaurant_id)
+    results = await get_search_json(db, q, country_filter, limit, offset, await catalog_version(db))
+    headers = catalog_headers(results["etag"])
     
-    if country_filter:
-        query = query.filter(Restaurant.country == country_filter)
+    if etag_matches(request, headers["ETag"]):
+        return not_modified(headers)
     
-    restaurant = query.first()
+    if results["next_offset"] is not None:
+        headers["X-Next-Offset"] = str(results["next_offset"])
+    return Response(content=results["body"], media_type="application/json", headers=headers)
+
+
+@router.get("/{restaurant_id}", response_model=RestaurantDetailResponse)
+async def get_restaurant(
+    restaurant_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    country_filter = get_country_filter(current_user)
+    restaurant = await get_restaurant_detail_json(db, restaurant_id, await catalog_version(db))
     
-    if not restaurant:
+    if not restaurant or (country_filter and restaurant["country"] != country_filter.value):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Restaurant not found"
         )
     
-    return restaurant
+    headers = catalog_headers(restaurant["etag"])
+    if etag_matches(request, headers["ETag"]):
+        return not_modified(headers)
+    
+    return Response(content=restaurant["body"], media_type="application/json", headers=headers)
@@ -12,6 +12,11 @@ class TokenResponse(BaseModel):
     token_type: str = "bearer"
 
 
+class StreamTokenResponse(BaseModel):
+    stream_token: str
+    expires_in: int
+
+
 class UserResponse(BaseModel):
     id: int
     email: str
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
 from datetime import datetime
 from app.models.order import OrderStatus
 from app.models.user import Country
@@ -7,7 +7,17 @@ from app.models.user import Country
 
 class AddToCartRequest(BaseModel):
     menu_item_id: int
-    quantity: int = 1
+    quantity: int = Field(1, ge=1)
+
+
+class CartLineOperation(BaseModel):
+    menu_item_id: int
+    op: Literal["add", "set", "remove"] = "add"
+    quantity: int = Field(1, ge=0)
+
+
+class BulkCartRequest(BaseModel):
+    operations: List[CartLineOperation] = Field(..., min_length=1, max_length=500)
 
 
 class OrderItemResponse(BaseModel):
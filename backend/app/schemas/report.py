@@ -0,0 +1,23 @@
+from datetime import date
+from pydantic import BaseModel
+from typing import Optional
+from app.models.user import Country
+
+
+class SalesSummaryResponse(BaseModel):
+    day: Optional[date] = None
+    country: Optional[Country] = None
+    restaurant_id: Optional[int] = None
+    restaurant_name: Optional[str] = None
+    orders_placed: int
+    orders_cancelled: int
+    revenue: float
+    items_sold: Optional[int] = None
+
+
+class TopMenuItemResponse(BaseModel):
+    menu_item_id: int
+    menu_item_name: str
+    restaurant_id: int
+    quantity: int
+    revenue: float
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Literal, Optional
 from app.models.user import Country
 
 
@@ -27,3 +27,13 @@ class RestaurantResponse(BaseModel):
 
 class RestaurantDetailResponse(RestaurantResponse):
     menu_items: List[MenuItemResponse] = []
+
+
+class SearchResult(BaseModel):
+    type: Literal["restaurant", "menu_item"]
+    id: int
+    restaurant_id: int
+    name: str
+    description: Optional[str]
+    price: Optional[float]
+    country: Country
@@ -0,0 +1,107 @@
+import re
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import is_sqlite
+from app.models.user import Country
+
+MAX_SEARCH_TERMS = 8
+
+POSTGRES_SEARCH_VECTOR = (
+    "(setweight(to_tsvector('simple', coalesce({alias}name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce({alias}description, '')), 'B'))"
+)
+
+# catalog_search and its triggers are created by migration 0003. Restaurants
+# live at rowid id * 2 and menu items at id * 2 + 1.
+SQLITE_SEARCH_QUERY = """
+    SELECT
+        catalog_search.rowid % 2 AS is_menu_item,
+        catalog_search.rowid / 2 AS id,
+        catalog_search.restaurant_id,
+        catalog_search.name,
+        catalog_search.description,
+        menu_items.price,
+        catalog_search.country
+    FROM catalog_search
+    LEFT JOIN menu_items ON catalog_search.rowid % 2 = 1 AND menu_items.id = catalog_search.rowid / 2
+    WHERE catalog_search MATCH :query {country_clause}
+    ORDER BY bm25(catalog_search, 10.0, 1.0), catalog_search.rowid
+    LIMIT :limit OFFSET :offset
+"""
+
+POSTGRES_SEARCH_QUERY = f"""
+    SELECT is_menu_item, id, restaurant_id, name, description, price, country FROM (
+        SELECT
+            0 AS is_menu_item,
+            r.id,
+            r.id AS restaurant_id,
+            r.name,
+            r.description,
+            CAST(NULL AS double precision) AS price,
+            r.country,
+            ts_rank({POSTGRES_SEARCH_VECTOR.format(alias='r.')}, query) AS rank
+        FROM restaurants r, to_tsquery('simple', :query) query
+        WHERE {POSTGRES_SEARCH_VECTOR.format(alias='r.')} @@ query {{country_clause}}
+        UNION ALL
+        SELECT
+            1,
+            m.id,
+            m.restaurant_id,
+            m.name,
+            m.description,
+            m.price,
+            r.country,
+            ts_rank({POSTGRES_SEARCH_VECTOR.format(alias='m.')}, query)
+        FROM menu_items m JOIN restaurants r ON r.id = m.restaurant_id, to_tsquery('simple', :query) query
+        WHERE {POSTGRES_SEARCH_VECTOR.format(alias='m.')} @@ query {{country_clause}}
+    ) results
+    ORDER BY rank DESC, is_menu_item, id
+    LIMIT :limit OFFSET :offset
+"""
+
+def search_terms(query: str) -> list[str]:
+    return re.findall(r"\w+", query.lower())[:MAX_SEARCH_TERMS]
+
+
+def match_expression(terms: list[str]) -> str:
+    if is_sqlite:
+        return " ".join(f'"{term}"*' for term in terms)
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+async def search_catalog(
+    db: AsyncSession,
+    query: str,
+    country: Country | None,
+    limit: int,
+    offset: int
+) -> list[dict]:
+    terms = search_terms(query)
+    if not terms:
+        return []
+
+    params = {"query": match_expression(terms), "limit": limit, "offset": offset}
+    if is_sqlite:
+        country_clause = "AND catalog_search.country = :country" if country else ""
+        statement = SQLITE_SEARCH_QUERY.format(country_clause=country_clause)
+    else:
+        country_clause = "AND r.country = :country" if country else ""
+        statement = POSTGRES_SEARCH_QUERY.format(country_clause=country_clause)
+    if country:
+        params["country"] = country.name
+
+    rows = await db.execute(text(statement), params)
+    return [
+        {
+            "type": "menu_item" if is_menu_item else "restaurant",
+            "id": result_id,
+            "restaurant_id": restaurant_id,
+            "name": name,
+            "description": description,
+            "price": price,
+            "country": Country[result_country].value
+        }
+        for is_menu_item, result_id, restaurant_id, name, description, price, result_country in rows
+    ]
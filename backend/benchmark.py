@@ -0,0 +1,395 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+FLOW_WEIGHTS = {
+    "browse": 40,
+    "cart": 25,
+    "history": 15,
+    "checkout": 10,
+    "login": 10,
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load-test the Slooze Eats API in-process")
+    parser.add_argument("--database-url", default="sqlite:///./benchmark.db")
+    parser.add_argument("--password", default="benchmark")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--restaurants", type=int, default=100)
+    parser.add_argument("--orders", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--active-users", type=int, default=50, help="synthetic users that log in and drive traffic")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of load")
+    parser.add_argument("--baseline", default="benchmark_baseline.json")
+    parser.add_argument("--save-baseline", action="store_true", help="overwrite the baseline with this run")
+    parser.add_argument("--max-regression", type=float, default=0.25, help="allowed p95 slowdown vs baseline")
+    parser.add_argument(
+        "--workers", type=parse_worker_counts,
+        help="comma-separated worker counts (e.g. 1,2,4); serves each with serve.py in a subprocess"
+    )
+    parser.add_argument("--scaling-report", default="benchmark_scaling.json")
+    return parser.parse_args()
+
+
+def parse_worker_counts(value: str) -> list[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, label: str, seconds: float, status_code: int):
+        self.latencies[label].append(seconds)
+        if status_code >= 500:
+            self.errors[label] += 1
+
+
+class QueryCounter:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        with self.lock:
+            self.count += 1
+
+
+class QueryProbe(Recorder):
+    def __init__(self, counter: QueryCounter):
+        super().__init__()
+        self.counter = counter
+        self.counts = {}
+        self.mark = counter.count
+
+    def record(self, label: str, seconds: float, status_code: int):
+        super().record(label, seconds, status_code)
+        self.counts[label] = self.counter.count - self.mark
+        self.mark = self.counter.count
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def timed(client, recorder: Recorder, label: str, method: str, url: str, **kwargs):
+    started_at = time.perf_counter()
+    response = await client.request(method, url, **kwargs)
+    recorder.record(label, time.perf_counter() - started_at, response.status_code)
+    return response
+
+
+async def browse_flow(client, recorder, user, catalog):
+    response = await timed(client, recorder, "GET /restaurants", "GET", "/restaurants", headers=user["headers"])
+    restaurants = response.json() if response.status_code == 200 else []
+    if restaurants:
+        restaurant_id = random.choice(restaurants)["id"]
+        await timed(client, recorder, "GET /restaurants/{id}", "GET", f"/restaurants/{restaurant_id}", headers=user["headers"])
+
+
+async def cart_flow(client, recorder, user, catalog):
+    menu_item_id = random.choice(catalog[user["country"]])
+    await timed(
+        client, recorder, "POST /orders/cart/items", "POST", "/orders/cart/items",
+        headers=user["headers"], json={"menu_item_id": menu_item_id, "quantity": random.randint(1, 3)}
+    )
+    response = await timed(client, recorder, "GET /orders/cart", "GET", "/orders/cart", headers=user["headers"])
+    items = response.json().get("items", []) if response.status_code == 200 else []
+    if len(items) > 3:
+        await timed(
+            client, recorder, "DELETE /orders/cart/items/{id}", "DELETE", f"/orders/cart/items/{items[0]['id']}",
+            headers=user["headers"]
+        )
+
+
+async def history_flow(client, recorder, user, catalog):
+    await timed(client, recorder, "GET /orders", "GET", "/orders", headers=user["headers"], params={"limit": 50})
+
+
+async def checkout_flow(client, recorder, user, catalog):
+    if user["role"] not in ("admin", "manager"):
+        return await cart_flow(client, recorder, user, catalog)
+    await timed(
+        client, recorder, "POST /orders/cart/items", "POST", "/orders/cart/items",
+        headers=user["headers"], json={"menu_item_id": random.choice(catalog[user["country"]]), "quantity": 1}
+    )
+    await timed(client, recorder, "POST /orders/checkout", "POST", "/orders/checkout", headers=user["headers"], json={})
+
+
+async def login_flow(client, recorder, user, catalog):
+    await timed(
+        client, recorder, "POST /auth/login", "POST", "/auth/login",
+        json={"email": user["email"], "password": user["password"]}
+    )
+
+
+FLOWS = {
+    "browse": browse_flow,
+    "cart": cart_flow,
+    "history": history_flow,
+    "checkout": checkout_flow,
+    "login": login_flow,
+}
+
+
+async def probe_query_counts(client, users, catalog, probe: "QueryProbe") -> dict:
+    user = next((user for user in users if user["role"] in ("admin", "manager")), users[0])
+    for name in FLOWS:
+        for _ in range(4):
+            await FLOWS[name](client, probe, user, catalog)
+    return probe.counts
+
+
+async def drive_load(client, users, catalog, concurrency: int, duration: float) -> tuple[Recorder, float]:
+    recorder = Recorder()
+    names = list(FLOW_WEIGHTS)
+    weights = list(FLOW_WEIGHTS.values())
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            flow = FLOWS[random.choices(names, weights=weights)[0]]
+            await flow(client, recorder, random.choice(users), catalog)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return recorder, time.perf_counter() - started_at
+
+
+def summarize(recorder: Recorder, elapsed: float, query_counts: dict) -> dict:
+    endpoints = {}
+    for label, samples in sorted(recorder.latencies.items()):
+        endpoints[label] = {
+            "count": len(samples),
+            "errors": recorder.errors[label],
+            "p50_ms": round(percentile(samples, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(samples, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(samples, 0.99) * 1000, 2),
+            "rps": round(len(samples) / elapsed, 1),
+            "queries": query_counts.get(label),
+        }
+    samples = [sample for label_samples in recorder.latencies.values() for sample in label_samples]
+    return {
+        "throughput_rps": round(len(samples) / elapsed, 1),
+        "p95_ms": round(percentile(samples, 0.95) * 1000, 2) if samples else None,
+        "errors": sum(recorder.errors.values()),
+        "endpoints": endpoints,
+    }
+
+
+def print_report(report: dict, baseline: dict | None):
+    print(f"\n{'endpoint':32} {'count':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'rps':>7} {'queries':>7} {'p95 vs base':>12}")
+    for label, stats in report["endpoints"].items():
+        delta = ""
+        if baseline and label in baseline["endpoints"]:
+            base_p95 = baseline["endpoints"][label]["p95_ms"]
+            delta = f"{(stats['p95_ms'] - base_p95) / base_p95:+.0%}" if base_p95 else ""
+        print(
+            f"{label:32} {stats['count']:>7} {stats['p50_ms']:>8} {stats['p95_ms']:>8} {stats['p99_ms']:>8} "
+            f"{stats['rps']:>7} {str(stats['queries']):>7} {delta:>12}"
+        )
+    print(f"\nthroughput: {report['throughput_rps']} req/s")
+    if baseline:
+        print(f"baseline throughput: {baseline['throughput_rps']} req/s")
+
+
+def regressions(report: dict, baseline: dict, max_regression: float) -> list:
+    slower = []
+    for label, stats in report["endpoints"].items():
+        base = baseline["endpoints"].get(label)
+        if base and base["p95_ms"] and stats["p95_ms"] > base["p95_ms"] * (1 + max_regression):
+            slower.append(label)
+    return slower
+
+
+async def login_users(client, accounts, password: str) -> list:
+    users = []
+    for email, role, country in accounts:
+        response = await client.post("/auth/login", json={"email": email, "password": password})
+        response.raise_for_status()
+        users.append({
+            "email": email,
+            "password": password,
+            "role": role.value,
+            "country": country.value,
+            "headers": {"Authorization": f"Bearer {response.json()['access_token']}"},
+        })
+    return users
+
+
+async def run_load(base_url: str, accounts, catalog, args, probe: "QueryProbe | None") -> dict:
+    import httpx
+
+    limits = httpx.Limits(max_connections=args.concurrency * 2)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        users = await login_users(client, accounts, args.password)
+        query_counts = await probe_query_counts(client, users, catalog, probe) if probe else {}
+        recorder, elapsed = await drive_load(client, users, catalog, args.concurrency, args.duration)
+        return summarize(recorder, elapsed, query_counts)
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    import httpx
+
+    process = subprocess.Popen(
+        [sys.executable, "serve.py", "--workers", str(workers), "--host", "127.0.0.1", "--port", str(port)],
+        cwd=BACKEND_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return process
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"serve.py with {workers} worker(s) did not become healthy")
+
+
+def run_scaling(args, accounts, catalog) -> list:
+    results = []
+    for workers in args.workers:
+        port = free_port()
+        process = start_server(workers, port)
+        try:
+            report = asyncio.run(run_load(f"http://127.0.0.1:{port}", accounts, catalog, args, None))
+        finally:
+            process.send_signal(signal.SIGTERM)
+            process.wait(timeout=60)
+        results.append({
+            "workers": workers,
+            "throughput_rps": report["throughput_rps"],
+            "p95_ms": report["p95_ms"],
+            "errors": report["errors"],
+        })
+        print(f"{workers} worker(s): {report['throughput_rps']} req/s, p95 {report['p95_ms']} ms")
+    return results
+
+
+def print_scaling(results: list):
+    base = results[0]["throughput_rps"] or 1
+    print(f"\n{'workers':>7} {'req/s':>8} {'speedup':>8} {'p95 ms':>8} {'errors':>7}")
+    for result in results:
+        print(
+            f"{result['workers']:>7} {result['throughput_rps']:>8} {result['throughput_rps'] / base:>7.2f}x "
+            f"{result['p95_ms']:>8} {result['errors']:>7}"
+        )
+
+
+def main():
+    args = parse_args()
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["SEED_PASSWORD"] = args.password
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+    import uvicorn
+    from sqlalchemy import event, select
+
+    import seed
+    from app import database
+    from app.main import app
+    from app.models.restaurant import Restaurant, MenuItem
+    from app.models.user import User
+
+    seed.seed_database()
+    seed.seed_synthetic(args.users, args.restaurants, args.orders, args.seed)
+
+    db = database.SessionLocal()
+    try:
+        catalog = defaultdict(list)
+        for menu_item_id, country in db.execute(
+            select(MenuItem.id, Restaurant.country).join(Restaurant, Restaurant.id == MenuItem.restaurant_id)
+        ):
+            catalog[country.value].append(menu_item_id)
+        catalog["global"] = catalog["india"] + catalog["america"]
+        accounts = db.execute(
+            select(User.email, User.role, User.country).filter(
+                User.email.like(f"%@{seed.SYNTHETIC_EMAIL_DOMAIN}")
+            ).order_by(User.id).limit(args.active_users)
+        ).all()
+    finally:
+        db.close()
+
+    if args.workers:
+        results = run_scaling(args, accounts, catalog)
+        print_scaling(results)
+        with open(args.scaling_report, "w") as report_file:
+            json.dump({
+                "cpu_count": os.cpu_count(),
+                "database_url": args.database_url,
+                "concurrency": args.concurrency,
+                "duration": args.duration,
+                "active_users": args.active_users,
+                "results": results,
+            }, report_file, indent=2)
+        print(f"scaling report saved to {args.scaling_report}")
+        return
+
+    counter = QueryCounter()
+    event.listen(database.get_async_engine().sync_engine, "before_cursor_execute", counter)
+
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    report = asyncio.run(run_load(f"http://127.0.0.1:{port}", accounts, catalog, args, QueryProbe(counter)))
+    server.should_exit = True
+    thread.join()
+
+    report["config"] = {
+        "users": args.users,
+        "restaurants": args.restaurants,
+        "orders": args.orders,
+        "active_users": args.active_users,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+    }
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+
+    print_report(report, baseline)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(report, baseline_file, indent=2)
+        print(f"baseline saved to {args.baseline}")
+    elif baseline:
+        slower = regressions(report, baseline, args.max_regression)
+        if slower:
+            print(f"p95 regressed by more than {args.max_regression:.0%}: {', '.join(slower)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+import orjson
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Compare the row-tuple/orjson list payloads with the ORM/Pydantic path they replace"
+    )
+    parser.add_argument("--database-url", help="defaults to a fresh SQLite file in a temp directory")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--restaurants", type=int, default=200)
+    parser.add_argument("--orders", type=int, default=5000)
+    parser.add_argument("--page-size", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=50)
+    return parser.parse_args()
+
+
+async def timed(label: str, iterations: int, run) -> tuple[float, bytes]:
+    samples = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        body = await run()
+        samples.append((time.perf_counter() - started_at) * 1000)
+    median = statistics.median(samples)
+    print(f"  {label:<28} median {median:8.2f} ms   p95 {sorted(samples)[int(len(samples) * 0.95) - 1]:8.2f} ms")
+    return median, body
+
+
+def normalized(body: bytes) -> list:
+    payload = orjson.loads(body)
+    for entry in payload:
+        if "items" in entry:
+            entry["items"].sort(key=lambda item: item["id"])
+    return payload
+
+
+async def compare(args):
+    from typing import List
+    from pydantic import TypeAdapter
+    from sqlalchemy import select
+
+    from app.catalog import load_restaurant_list_json
+    from app.database import AsyncSessionLocal
+    from app.models.order import Order, OrderStatus
+    from app.models.restaurant import Restaurant
+    from app.routes.orders import order_list_payload, order_query, get_order_response
+    from app.schemas.order import OrderResponse
+    from app.schemas.restaurant import RestaurantResponse
+
+    orders_adapter = TypeAdapter(List[OrderResponse])
+    restaurants_adapter = TypeAdapter(List[RestaurantResponse])
+    newest_first = (Order.created_at.desc(), Order.id.desc())
+    page_query = select(
+        Order.id,
+        Order.status,
+        Order.total_minor,
+        Order.country,
+        Order.created_at,
+        Order.updated_at
+    ).filter(Order.status != OrderStatus.CART).order_by(*newest_first).limit(args.page_size)
+
+    async with AsyncSessionLocal() as db:
+        async def orders_orm():
+            rows = (await db.execute(page_query)).all()
+            orders = (await db.scalars(
+                order_query().filter(Order.id.in_([row.id for row in rows])).order_by(*newest_first)
+            )).all()
+            db.expunge_all()
+            responses = [get_order_response(order) for order in orders]
+            return orders_adapter.dump_json(orders_adapter.validate_python(responses, from_attributes=True))
+
+        async def orders_rows():
+            rows = (await db.execute(page_query)).all()
+            return orjson.dumps(await order_list_payload(db, rows))
+
+        async def restaurants_orm():
+            restaurants = (await db.scalars(select(Restaurant).order_by(Restaurant.id))).all()
+            db.expunge_all()
+            return restaurants_adapter.dump_json(
+                restaurants_adapter.validate_python(restaurants, from_attributes=True)
+            )
+
+        async def restaurants_rows():
+            return (await load_restaurant_list_json(db, None)).encode()
+
+        for name, baseline, fast in (
+            (f"GET /orders (page of {args.page_size})", orders_orm, orders_rows),
+            ("GET /restaurants (uncached)", restaurants_orm, restaurants_rows),
+        ):
+            print(name)
+            baseline_ms, baseline_body = await timed("ORM + Pydantic", args.iterations, baseline)
+            fast_ms, fast_body = await timed("row tuples + orjson", args.iterations, fast)
+            if normalized(baseline_body) != normalized(fast_body):
+                raise SystemExit(f"{name}: payloads differ")
+            print(f"  speedup {baseline_ms / fast_ms:.2f}x, identical payloads ({len(fast_body)} bytes)\n")
+
+
+def main():
+    args = parse_args()
+    database_url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/benchmark_serialization.db"
+    os.environ["DATABASE_URL"] = database_url
+
+    import seed
+
+    seed.seed_synthetic(args.users, args.restaurants, args.orders)
+    asyncio.run(compare(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import closing
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from sqlalchemy.engine import make_url
+
+from app.config import settings
+from app.database import dispose_engines, get_engine
+from app.outbox import OutboxWorkerPool
+from app.push import push_broker
+from app.reports import rebuild_sales_reports
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+BASELINE_REVISION = "0001"
+STARTUP_BUDGET_MS = 2500.0
+
+COLD_START_PROBE = """
+import asyncio, json, time
+started_at = time.perf_counter()
+from app import database
+from app.main import app
+imported_at = time.perf_counter()
+engine_built_on_import = database.get_engine.cache_info().currsize + database.get_async_engine.cache_info().currsize
+
+async def run_lifespan():
+    async with app.router.lifespan_context(app):
+        pass
+
+asyncio.run(run_lifespan())
+print(json.dumps({
+    "import_ms": (imported_at - started_at) * 1000,
+    "startup_ms": (time.perf_counter() - imported_at) * 1000,
+    "engine_built_on_import": engine_built_on_import > 0,
+}))
+"""
+
+
+def alembic_config() -> Config:
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+    return config
+
+
+def unversioned_schema() -> dict | None:
+    with get_engine().connect() as connection:
+        inspector = inspect(connection)
+        tables = inspector.get_table_names()
+        if "alembic_version" in tables or "orders" not in tables:
+            return None
+        return {column["name"] for column in inspector.get_columns("orders")}
+
+
+def migrate(revision: str = "head"):
+    config = alembic_config()
+    columns = unversioned_schema()
+    if columns is not None:
+        # Databases from before migrations were built by create_all and hold
+        # the baseline schema; adopt them at 0001 so the rest of the chain runs.
+        if "total_amount" not in columns:
+            raise SystemExit("database has no alembic_version and is not the baseline schema; stamp it by hand")
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, revision)
+
+
+def stamp(revision: str):
+    command.stamp(alembic_config(), revision)
+
+
+def sync_replica(interval: float | None = None):
+    if not settings.database_replica_url:
+        raise SystemExit("DATABASE_REPLICA_URL is not set")
+    primary, replica = make_url(settings.database_url), make_url(settings.database_replica_url)
+    if primary.get_backend_name() != "sqlite" or replica.get_backend_name() != "sqlite":
+        raise SystemExit("sync-replica only copies SQLite files; use streaming replication for Postgres")
+
+    while True:
+        started_at = time.perf_counter()
+        with closing(sqlite3.connect(primary.database)) as source, closing(sqlite3.connect(replica.database)) as target:
+            source.backup(target)
+        print(f"synced {primary.database} -> {replica.database} in {(time.perf_counter() - started_at) * 1000:.1f}ms")
+        if not interval:
+            return
+        time.sleep(interval)
+
+
+def rebuild_reports():
+    started_at = time.perf_counter()
+    with get_engine().begin() as conn:
+        rebuild_sales_reports(conn)
+    print(f"rebuilt sales summaries in {(time.perf_counter() - started_at) * 1000:.1f}ms")
+
+
+async def run_outbox_workers(workers: int):
+    pool = OutboxWorkerPool(workers)
+    stopped = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stopped.set)
+
+    pool.start()
+    print(f"outbox: {workers} worker(s) polling every {settings.outbox_poll_seconds}s")
+    await stopped.wait()
+    await pool.stop()
+    await push_broker.stop()
+    await dispose_engines()
+
+
+def measure_cold_start() -> dict:
+    started_at = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", COLD_START_PROBE],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result["total_ms"] = (time.perf_counter() - started_at) * 1000
+    return result
+
+
+def check_startup(budget_ms: float, runs: int) -> bool:
+    samples = [measure_cold_start() for _ in range(runs)]
+    for name in ("import_ms", "startup_ms", "total_ms"):
+        print(f"{name:<12} median {statistics.median(sample[name] for sample in samples):8.1f}  "
+              f"max {max(sample[name] for sample in samples):8.1f}")
+
+    ok = True
+    if any(sample["engine_built_on_import"] for sample in samples):
+        print("FAIL importing app.main built a database engine")
+        ok = False
+    median_total = statistics.median(sample["total_ms"] for sample in samples)
+    if median_total > budget_ms:
+        print(f"FAIL median cold start {median_total:.1f}ms exceeds budget {budget_ms:.1f}ms")
+        ok = False
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Slooze Eats management commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = subparsers.add_parser("migrate", help="apply schema migrations")
+    migrate_parser.add_argument("--revision", default="head")
+
+    stamp_parser = subparsers.add_parser(
+        "stamp", help="record a revision without running it (pre-migration databases are adopted by migrate)"
+    )
+    stamp_parser.add_argument("--revision", required=True)
+
+    replica_parser = subparsers.add_parser(
+        "sync-replica", help="copy the SQLite primary into the replica file (local read-replica testing)"
+    )
+    replica_parser.add_argument("--interval", type=float, help="keep syncing every N seconds")
+
+    subparsers.add_parser(
+        "rebuild-reports", help="recompute the sales summary tables from orders (after bulk imports or drift)"
+    )
+
+    outbox_parser = subparsers.add_parser(
+        "outbox-worker", help="drain the order event outbox in a standalone process"
+    )
+    outbox_parser.add_argument("--workers", type=int, default=max(settings.outbox_workers, 1))
+
+    startup_parser = subparsers.add_parser("check-startup", help="measure cold start against a time budget")
+    startup_parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS)
+    startup_parser.add_argument("--runs", type=int, default=5)
+
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        migrate(args.revision)
+    elif args.command == "stamp":
+        stamp(args.revision)
+    elif args.command == "sync-replica":
+        sync_replica(args.interval)
+    elif args.command == "rebuild-reports":
+        rebuild_reports()
+    elif args.command == "outbox-worker":
+        logging.basicConfig(level=logging.INFO)
+        asyncio.run(run_outbox_workers(args.workers))
+    elif args.command == "check-startup":
+        if not check_startup(args.budget_ms, args.runs):
+            sys.exit(1)
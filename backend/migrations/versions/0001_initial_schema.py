@@ -0,0 +1,123 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 08:33:59.603523
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('restaurants',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('image_url', sa.String(), nullable=True),
+    sa.Column('country', sa.Enum('INDIA', 'AMERICA', 'GLOBAL', name='country'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('restaurants', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_restaurants_id'), ['id'], unique=False)
+
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(), nullable=False),
+    sa.Column('password', sa.String(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('role', sa.Enum('ADMIN', 'MANAGER', 'MEMBER', name='userrole'), nullable=False),
+    sa.Column('country', sa.Enum('INDIA', 'AMERICA', 'GLOBAL', name='country'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_users_email'), ['email'], unique=True)
+        batch_op.create_index(batch_op.f('ix_users_id'), ['id'], unique=False)
+
+    op.create_table('menu_items',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('restaurant_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.Column('price', sa.Float(), nullable=False),
+    sa.Column('image_url', sa.String(), nullable=True),
+    sa.ForeignKeyConstraint(['restaurant_id'], ['restaurants.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('menu_items', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_menu_items_id'), ['id'], unique=False)
+
+    op.create_table('orders',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('CART', 'PLACED', 'COMPLETED', 'CANCELLED', name='orderstatus'), nullable=False),
+    sa.Column('total_amount', sa.Float(), nullable=True),
+    sa.Column('country', sa.Enum('INDIA', 'AMERICA', 'GLOBAL', name='country'), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_orders_id'), ['id'], unique=False)
+
+    op.create_table('payment_methods',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('type', sa.Enum('CARD', 'UPI', 'NETBANKING', name='paymenttype'), nullable=False),
+    sa.Column('last_four', sa.String(length=4), nullable=False),
+    sa.Column('is_default', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('payment_methods', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_payment_methods_id'), ['id'], unique=False)
+
+    op.create_table('order_items',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('order_id', sa.Integer(), nullable=False),
+    sa.Column('menu_item_id', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=True),
+    sa.Column('price', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['menu_item_id'], ['menu_items.id'], ),
+    sa.ForeignKeyConstraint(['order_id'], ['orders.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('order_items', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_order_items_id'), ['id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('order_items', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_order_items_id'))
+
+    op.drop_table('order_items')
+    with op.batch_alter_table('payment_methods', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_payment_methods_id'))
+
+    op.drop_table('payment_methods')
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_orders_id'))
+
+    op.drop_table('orders')
+    with op.batch_alter_table('menu_items', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_menu_items_id'))
+
+    op.drop_table('menu_items')
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_id'))
+        batch_op.drop_index(batch_op.f('ix_users_email'))
+
+    op.drop_table('users')
+    with op.batch_alter_table('restaurants', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_restaurants_id'))
+
+    op.drop_table('restaurants')
+
+    for enum_name in ('paymenttype', 'orderstatus', 'userrole', 'country'):
+        sa.Enum(name=enum_name).drop(op.get_bind(), checkfirst=True)
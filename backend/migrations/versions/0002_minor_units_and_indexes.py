@@ -0,0 +1,135 @@
+"""minor unit money columns and hot-path indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 08:34:41.220957
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+orders = sa.table('orders',
+    sa.column('id', sa.Integer()),
+    sa.column('user_id', sa.Integer()),
+    sa.column('status', sa.String()),
+    sa.column('total_amount', sa.Float()),
+    sa.column('total_minor', sa.Integer())
+)
+order_items = sa.table('order_items',
+    sa.column('id', sa.Integer()),
+    sa.column('order_id', sa.Integer()),
+    sa.column('menu_item_id', sa.Integer()),
+    sa.column('quantity', sa.Integer()),
+    sa.column('price', sa.Float()),
+    sa.column('price_minor', sa.Integer())
+)
+
+
+def to_minor(column):
+    # Numeric keeps the rounding half-up on both SQLite and Postgres, like app.money.to_minor.
+    return sa.cast(sa.func.round(sa.cast(column, sa.Numeric()) * 100), sa.Integer())
+
+
+def merge_duplicate_rows():
+    # Baseline code could race into a second cart or a second line for the same
+    # item; fold them together so the unique indexes below can be built. Lines of
+    # a user's extra carts move to their oldest cart before the empty carts go.
+    kept_carts = sa.select(sa.func.min(orders.c.id)).filter(orders.c.status == 'CART').group_by(orders.c.user_id)
+    extra_carts = sa.select(orders.c.id).filter(orders.c.status == 'CART', orders.c.id.not_in(kept_carts))
+    owner = orders.alias('owner')
+    kept = orders.alias('kept')
+    kept_cart = sa.select(sa.func.min(kept.c.id)).select_from(
+        kept.join(owner, owner.c.user_id == kept.c.user_id)
+    ).filter(owner.c.id == order_items.c.order_id, kept.c.status == 'CART').scalar_subquery()
+    op.execute(order_items.update().filter(order_items.c.order_id.in_(extra_carts)).values(order_id=kept_cart))
+    op.execute(orders.delete().filter(orders.c.id.in_(extra_carts)))
+
+    duplicate = order_items.alias('duplicate')
+    same_line = sa.and_(
+        duplicate.c.order_id == order_items.c.order_id,
+        duplicate.c.menu_item_id == order_items.c.menu_item_id
+    )
+    kept_lines = sa.select(sa.func.min(order_items.c.id)).group_by(order_items.c.order_id, order_items.c.menu_item_id)
+    op.execute(order_items.update().filter(order_items.c.id.in_(kept_lines)).values(
+        quantity=sa.select(sa.func.sum(duplicate.c.quantity)).filter(same_line).scalar_subquery()
+    ))
+    op.execute(order_items.delete().filter(order_items.c.id.not_in(kept_lines)))
+
+    cart_total = sa.select(sa.func.coalesce(sa.func.sum(order_items.c.quantity * order_items.c.price_minor), 0)).filter(
+        order_items.c.order_id == orders.c.id
+    ).scalar_subquery()
+    op.execute(orders.update().filter(orders.c.status == 'CART').values(total_minor=cart_total))
+
+
+def upgrade():
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('total_minor', sa.Integer(), nullable=True))
+    with op.batch_alter_table('order_items', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('price_minor', sa.Integer(), nullable=True))
+
+    op.execute(orders.update().values(total_minor=sa.func.coalesce(to_minor(orders.c.total_amount), 0)))
+    op.execute(order_items.update().values(price_minor=to_minor(order_items.c.price)))
+    merge_duplicate_rows()
+
+    with op.batch_alter_table('restaurants', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_restaurants_country'), ['country'], unique=False)
+
+    with op.batch_alter_table('menu_items', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_menu_items_restaurant_id'), ['restaurant_id'], unique=False)
+
+    with op.batch_alter_table('payment_methods', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_payment_methods_user_id'), ['user_id'], unique=False)
+
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.alter_column('total_minor', existing_type=sa.Integer(), nullable=False)
+        batch_op.drop_column('total_amount')
+        batch_op.create_index('ix_orders_country_status_created_at_id', ['country', 'status', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_orders_created_at_id', ['created_at', 'id'], unique=False)
+        batch_op.create_index('ix_orders_status_created_at_id', ['status', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_orders_user_id_created_at_id', ['user_id', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_orders_user_id_status_created_at_id', ['user_id', 'status', 'created_at', 'id'], unique=False)
+        batch_op.create_index('uq_orders_user_id_cart', ['user_id'], unique=True, sqlite_where=sa.text("status = 'CART'"), postgresql_where=sa.text("status = 'CART'"))
+
+    with op.batch_alter_table('order_items', schema=None) as batch_op:
+        batch_op.alter_column('price_minor', existing_type=sa.Integer(), nullable=False)
+        batch_op.drop_column('price')
+        batch_op.create_index('uq_order_items_order_id_menu_item_id', ['order_id', 'menu_item_id'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('order_items', schema=None) as batch_op:
+        batch_op.drop_index('uq_order_items_order_id_menu_item_id')
+        batch_op.add_column(sa.Column('price', sa.Float(), nullable=True))
+
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.drop_index('uq_orders_user_id_cart', sqlite_where=sa.text("status = 'CART'"), postgresql_where=sa.text("status = 'CART'"))
+        batch_op.drop_index('ix_orders_user_id_status_created_at_id')
+        batch_op.drop_index('ix_orders_user_id_created_at_id')
+        batch_op.drop_index('ix_orders_status_created_at_id')
+        batch_op.drop_index('ix_orders_created_at_id')
+        batch_op.drop_index('ix_orders_country_status_created_at_id')
+        batch_op.add_column(sa.Column('total_amount', sa.Float(), nullable=True))
+
+    op.execute(order_items.update().values(price=order_items.c.price_minor / 100.0))
+    op.execute(orders.update().values(total_amount=orders.c.total_minor / 100.0))
+
+    with op.batch_alter_table('order_items', schema=None) as batch_op:
+        batch_op.alter_column('price', existing_type=sa.Float(), nullable=False)
+        batch_op.drop_column('price_minor')
+
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.drop_column('total_minor')
+
+    with op.batch_alter_table('payment_methods', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_payment_methods_user_id'))
+
+    with op.batch_alter_table('menu_items', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_menu_items_restaurant_id'))
+
+    with op.batch_alter_table('restaurants', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_restaurants_country'))
@@ -0,0 +1,111 @@
+"""catalog full-text search
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 09:40:12.118204
+"""
+from alembic import op
+
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+# Restaurants and menu items share one FTS5 table; rowid = id * 2 for a
+# restaurant and id * 2 + 1 for a menu item so triggers can address rows
+# without scanning the unindexed columns.
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE catalog_search USING fts5(
+        name,
+        description,
+        restaurant_id UNINDEXED,
+        country UNINDEXED,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER restaurants_search_insert AFTER INSERT ON restaurants BEGIN
+        INSERT INTO catalog_search (rowid, name, description, restaurant_id, country)
+        VALUES (new.id * 2, new.name, new.description, new.id, new.country);
+    END
+    """,
+    """
+    CREATE TRIGGER restaurants_search_update AFTER UPDATE ON restaurants BEGIN
+        UPDATE catalog_search SET name = new.name, description = new.description, country = new.country
+        WHERE rowid = new.id * 2;
+        UPDATE catalog_search SET country = new.country
+        WHERE rowid IN (SELECT id * 2 + 1 FROM menu_items WHERE restaurant_id = new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER restaurants_search_delete AFTER DELETE ON restaurants BEGIN
+        DELETE FROM catalog_search WHERE rowid = old.id * 2;
+    END
+    """,
+    """
+    CREATE TRIGGER menu_items_search_insert AFTER INSERT ON menu_items BEGIN
+        INSERT INTO catalog_search (rowid, name, description, restaurant_id, country)
+        SELECT new.id * 2 + 1, new.name, new.description, new.restaurant_id, country
+        FROM restaurants WHERE id = new.restaurant_id;
+    END
+    """,
+    """
+    CREATE TRIGGER menu_items_search_update AFTER UPDATE ON menu_items BEGIN
+        DELETE FROM catalog_search WHERE rowid = old.id * 2 + 1;
+        INSERT INTO catalog_search (rowid, name, description, restaurant_id, country)
+        SELECT new.id * 2 + 1, new.name, new.description, new.restaurant_id, country
+        FROM restaurants WHERE id = new.restaurant_id;
+    END
+    """,
+    """
+    CREATE TRIGGER menu_items_search_delete AFTER DELETE ON menu_items BEGIN
+        DELETE FROM catalog_search WHERE rowid = old.id * 2 + 1;
+    END
+    """,
+    """
+    INSERT INTO catalog_search (rowid, name, description, restaurant_id, country)
+    SELECT id * 2, name, description, id, country FROM restaurants
+    """,
+    """
+    INSERT INTO catalog_search (rowid, name, description, restaurant_id, country)
+    SELECT menu_items.id * 2 + 1, menu_items.name, menu_items.description, menu_items.restaurant_id, restaurants.country
+    FROM menu_items JOIN restaurants ON restaurants.id = menu_items.restaurant_id
+    """,
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER menu_items_search_delete",
+    "DROP TRIGGER menu_items_search_update",
+    "DROP TRIGGER menu_items_search_insert",
+    "DROP TRIGGER restaurants_search_delete",
+    "DROP TRIGGER restaurants_search_update",
+    "DROP TRIGGER restaurants_search_insert",
+    "DROP TABLE catalog_search",
+]
+
+POSTGRES_UPGRADE = [
+    "CREATE INDEX ix_restaurants_search ON restaurants USING gin ((setweight(to_tsvector('simple', coalesce(name, '')), 'A') || setweight(to_tsvector('simple', coalesce(description, '')), 'B')))",
+    "CREATE INDEX ix_menu_items_search ON menu_items USING gin ((setweight(to_tsvector('simple', coalesce(name, '')), 'A') || setweight(to_tsvector('simple', coalesce(description, '')), 'B')))",
+]
+
+POSTGRES_DOWNGRADE = [
+    "DROP INDEX ix_menu_items_search",
+    "DROP INDEX ix_restaurants_search",
+]
+
+
+def statements(sqlite, postgresql):
+    return sqlite if op.get_bind().dialect.name == "sqlite" else postgresql
+
+
+def upgrade():
+    for statement in statements(SQLITE_UPGRADE, POSTGRES_UPGRADE):
+        op.execute(statement)
+
+
+def downgrade():
+    for statement in statements(SQLITE_DOWNGRADE, POSTGRES_DOWNGRADE):
+        op.execute(statement)
@@ -0,0 +1,146 @@
+"""sales report summaries
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 08:49:51.801166
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+# The country enum type already exists on Postgres (created with users).
+country = postgresql.ENUM('INDIA', 'AMERICA', 'GLOBAL', name='country', create_type=False)
+
+# Snapshots of the tables as of this revision, so the backfill does not move
+# when the application models change.
+orders = sa.table('orders',
+    sa.column('id', sa.Integer()),
+    sa.column('status', sa.String()),
+    sa.column('country', sa.String()),
+    sa.column('total_minor', sa.Integer()),
+    sa.column('created_at', sa.DateTime()),
+    sa.column('placed_at', sa.DateTime())
+)
+order_items = sa.table('order_items',
+    sa.column('order_id', sa.Integer()),
+    sa.column('menu_item_id', sa.Integer()),
+    sa.column('quantity', sa.Integer()),
+    sa.column('price_minor', sa.Integer())
+)
+menu_items = sa.table('menu_items',
+    sa.column('id', sa.Integer()),
+    sa.column('restaurant_id', sa.Integer())
+)
+country_sales_daily = sa.table('country_sales_daily',
+    sa.column('day'), sa.column('country'), sa.column('orders_placed'), sa.column('orders_cancelled'),
+    sa.column('revenue_minor')
+)
+restaurant_sales_daily = sa.table('restaurant_sales_daily',
+    sa.column('day'), sa.column('country'), sa.column('restaurant_id'), sa.column('orders_placed'),
+    sa.column('orders_cancelled'), sa.column('revenue_minor'), sa.column('items_sold')
+)
+menu_item_sales_daily = sa.table('menu_item_sales_daily',
+    sa.column('day'), sa.column('country'), sa.column('menu_item_id'), sa.column('restaurant_id'),
+    sa.column('quantity'), sa.column('revenue_minor')
+)
+
+
+def backfill_sales_reports():
+    day = sa.func.date(sa.func.coalesce(orders.c.placed_at, orders.c.created_at))
+    is_cancelled = orders.c.status == 'CANCELLED'
+    line_revenue = order_items.c.quantity * order_items.c.price_minor
+
+    def live(value):
+        return sa.func.coalesce(sa.func.sum(sa.case((is_cancelled, 0), else_=value)), 0)
+
+    op.execute(country_sales_daily.insert().from_select(
+        ['day', 'country', 'orders_placed', 'orders_cancelled', 'revenue_minor'],
+        sa.select(
+            day,
+            orders.c.country,
+            sa.func.count(),
+            sa.func.sum(sa.case((is_cancelled, 1), else_=0)),
+            live(orders.c.total_minor)
+        ).filter(orders.c.status != 'CART').group_by(day, orders.c.country)
+    ))
+
+    order_lines = sa.select().select_from(order_items).join(orders, orders.c.id == order_items.c.order_id).join(
+        menu_items, menu_items.c.id == order_items.c.menu_item_id
+    ).filter(orders.c.status != 'CART')
+
+    op.execute(restaurant_sales_daily.insert().from_select(
+        ['day', 'country', 'restaurant_id', 'orders_placed', 'orders_cancelled', 'revenue_minor', 'items_sold'],
+        order_lines.add_columns(
+            day,
+            orders.c.country,
+            menu_items.c.restaurant_id,
+            sa.func.count(sa.func.distinct(orders.c.id)),
+            sa.func.count(sa.func.distinct(sa.case((is_cancelled, orders.c.id)))),
+            live(line_revenue),
+            live(order_items.c.quantity)
+        ).group_by(day, orders.c.country, menu_items.c.restaurant_id)
+    ))
+
+    op.execute(menu_item_sales_daily.insert().from_select(
+        ['day', 'country', 'menu_item_id', 'restaurant_id', 'quantity', 'revenue_minor'],
+        order_lines.add_columns(
+            day,
+            orders.c.country,
+            order_items.c.menu_item_id,
+            menu_items.c.restaurant_id,
+            live(order_items.c.quantity),
+            live(line_revenue)
+        ).group_by(day, orders.c.country, order_items.c.menu_item_id, menu_items.c.restaurant_id)
+    ))
+
+
+def upgrade():
+    op.create_table('country_sales_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('country', country, nullable=False),
+    sa.Column('orders_placed', sa.Integer(), nullable=False),
+    sa.Column('orders_cancelled', sa.Integer(), nullable=False),
+    sa.Column('revenue_minor', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'country')
+    )
+    op.create_table('restaurant_sales_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('country', country, nullable=False),
+    sa.Column('restaurant_id', sa.Integer(), nullable=False),
+    sa.Column('orders_placed', sa.Integer(), nullable=False),
+    sa.Column('orders_cancelled', sa.Integer(), nullable=False),
+    sa.Column('revenue_minor', sa.Integer(), nullable=False),
+    sa.Column('items_sold', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['restaurant_id'], ['restaurants.id'], ),
+    sa.PrimaryKeyConstraint('day', 'country', 'restaurant_id')
+    )
+    op.create_table('menu_item_sales_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('country', country, nullable=False),
+    sa.Column('menu_item_id', sa.Integer(), nullable=False),
+    sa.Column('restaurant_id', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('revenue_minor', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['menu_item_id'], ['menu_items.id'], ),
+    sa.ForeignKeyConstraint(['restaurant_id'], ['restaurants.id'], ),
+    sa.PrimaryKeyConstraint('day', 'country', 'menu_item_id')
+    )
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('placed_at', sa.DateTime(), nullable=True))
+
+    backfill_sales_reports()
+
+
+def downgrade():
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.drop_column('placed_at')
+
+    op.drop_table('menu_item_sales_daily')
+    op.drop_table('restaurant_sales_daily')
+    op.drop_table('country_sales_daily')
@@ -0,0 +1,37 @@
+"""order event outbox
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 08:53:11.653753
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('outbox_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('topic', sa.String(), nullable=False),
+    sa.Column('payload', sa.Text(), nullable=False),
+    sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('available_at', sa.DateTime(), nullable=False),
+    sa.Column('failed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('outbox_events', schema=None) as batch_op:
+        batch_op.create_index('ix_outbox_events_due', ['available_at', 'id'], unique=False, sqlite_where=sa.text('failed_at IS NULL'), postgresql_where=sa.text('failed_at IS NULL'))
+
+
+def downgrade():
+    with op.batch_alter_table('outbox_events', schema=None) as batch_op:
+        batch_op.drop_index('ix_outbox_events_due', sqlite_where=sa.text('failed_at IS NULL'), postgresql_where=sa.text('failed_at IS NULL'))
+
+    op.drop_table('outbox_events')
@@ -0,0 +1,24 @@
+"""order items by order in id order
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 12:06:18.530441
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('order_items', schema=None) as batch_op:
+        batch_op.create_index('ix_order_items_order_id_id', ['order_id', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('order_items', schema=None) as batch_op:
+        batch_op.drop_index('ix_order_items_order_id_id')
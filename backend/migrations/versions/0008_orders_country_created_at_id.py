@@ -0,0 +1,24 @@
+"""orders by country in listing order
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 12:21:47.093316
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.create_index('ix_orders_country_created_at_id', ['country', 'created_at', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.drop_index('ix_orders_country_created_at_id')
@@ -0,0 +1,77 @@
+"""shared catalog version bumped by triggers
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 12:40:05.662713
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+CATALOG_TABLES = ('restaurants', 'menu_items')
+
+
+def sqlite_upgrade():
+    for table in CATALOG_TABLES:
+        for action in ('INSERT', 'UPDATE', 'DELETE'):
+            op.execute(f"""
+                CREATE TRIGGER {table}_catalog_version_{action.lower()} AFTER {action} ON {table} BEGIN
+                    UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+                END
+            """)
+
+
+def sqlite_downgrade():
+    for table in CATALOG_TABLES:
+        for action in ('INSERT', 'UPDATE', 'DELETE'):
+            op.execute(f"DROP TRIGGER {table}_catalog_version_{action.lower()}")
+
+
+def postgresql_upgrade():
+    op.execute("""
+        CREATE FUNCTION bump_catalog_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    for table in CATALOG_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_catalog_version AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version()
+        """)
+
+
+def postgresql_downgrade():
+    for table in CATALOG_TABLES:
+        op.execute(f"DROP TRIGGER {table}_catalog_version ON {table}")
+    op.execute("DROP FUNCTION bump_catalog_version()")
+
+
+def upgrade():
+    op.create_table('catalog_version',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("INSERT INTO catalog_version (id, version) VALUES (1, 1)")
+
+    if op.get_bind().dialect.name == 'sqlite':
+        sqlite_upgrade()
+    else:
+        postgresql_upgrade()
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'sqlite':
+        sqlite_downgrade()
+    else:
+        postgresql_downgrade()
+
+    op.drop_table('catalog_version')
@@ -0,0 +1,59 @@
+import argparse
+from sqlalchemy import func, select, update
+
+from app.database import SessionLocal
+from app.models.order import Order, OrderItem
+from app.money import to_major
+
+
+def line_total():
+    return select(
+        func.coalesce(func.sum(OrderItem.price_minor * OrderItem.quantity), 0)
+    ).filter(OrderItem.order_id == Order.id).scalar_subquery()
+
+
+def reconcile_order_totals(fix: bool = False, batch_size: int = 10000):
+    db = SessionLocal()
+    mismatches = []
+
+    try:
+        first_id, last_id = db.execute(select(func.min(Order.id), func.max(Order.id))).one()
+        if first_id is None:
+            print("No orders to reconcile")
+            return mismatches
+
+        for start in range(first_id, last_id + 1, batch_size):
+            in_batch = Order.id.between(start, start + batch_size - 1)
+            expected = line_total()
+            batch = db.execute(
+                select(Order.id, Order.total_minor, expected.label("expected")).filter(
+                    in_batch,
+                    Order.total_minor != expected
+                )
+            ).all()
+            mismatches.extend(batch)
+
+            if fix and batch:
+                db.execute(
+                    update(Order).filter(in_batch, Order.total_minor != line_total()).values(
+                        total_minor=line_total()
+                    )
+                )
+                db.commit()
+
+        for order_id, total_minor, expected in mismatches:
+            print(f"  order {order_id}: stored {to_major(total_minor)}, expected {to_major(expected)}")
+        action = "fixed" if fix else "found"
+        print(f"{len(mismatches)} mismatched order totals {action}")
+        return mismatches
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verify order totals against their line items")
+    parser.add_argument("--fix", action="store_true", help="rewrite mismatched totals")
+    parser.add_argument("--batch-size", type=int, default=10000)
+    args = parser.parse_args()
+    reconcile_order_totals(fix=args.fix, batch_size=args.batch_size)
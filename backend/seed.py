@@ -1,14 +1,30 @@
+import argparse
+import csv
+import enum
+import io
 import os
-from app.database import engine, SessionLocal, Base
+import random
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, insert, select, text
+
+from app.database import get_engine, SessionLocal
 from app.models.user import User, UserRole, Country
 from app.models.restaurant import Restaurant, MenuItem
-from app.models.order import Order, OrderItem
+from app.models.order import Order, OrderItem, OrderStatus
 from app.models.payment import PaymentMethod, PaymentType
 from app.auth.password import hash_password
+from app.money import to_minor
+from app.reports import rebuild_sales_reports
+from manage import migrate
+
+SYNTHETIC_EMAIL_DOMAIN = "synthetic.slooze.com"
+SYNTHETIC_BATCH_SIZE = 10000
 
 
 def seed_database():
-    Base.metadata.create_all(bind=engine)
+    migrate()
     db = SessionLocal()
     
     # Get password from env or use default for dev
@@ -145,5 +161,217 @@ def seed_database():
         db.close()
 
 
+def next_id(conn, table) -> int:
+    return (conn.execute(select(func.max(table.c.id))).scalar() or 0) + 1
+
+
+def copy_rows(conn, table, columns, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([
+            "" if value is None else value.name if isinstance(value, enum.Enum) else value
+            for value in row
+        ])
+    buffer.seek(0)
+    cursor = conn.connection.dbapi_connection.cursor()
+    cursor.copy_expert(
+        f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer
+    )
+
+
+def bulk_insert(conn, table, columns, rows):
+    if not rows:
+        return
+    if conn.dialect.name == "postgresql":
+        copy_rows(conn, table, columns, rows)
+    else:
+        conn.execute(insert(table), [dict(zip(columns, row)) for row in rows])
+
+
+def reset_sequences(conn, tables):
+    if conn.dialect.name != "postgresql":
+        return
+    for table in tables:
+        conn.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+            f"(SELECT COALESCE(MAX(id), 1) FROM {table.name}))"
+        ))
+
+
+def seed_synthetic(
+    users: int = 1000,
+    restaurants: int = 100,
+    orders: int = 10000,
+    seed: int = 42,
+    menu_items: int | None = None,
+    items_per_order: int = 5,
+    payment_methods: int = 0,
+    batch_size: int = SYNTHETIC_BATCH_SIZE
+):
+    migrate()
+    rng = random.Random(seed)
+    menu_items = restaurants * 12 if menu_items is None else menu_items
+    
+    seed_password = os.getenv("SEED_PASSWORD", "")
+    hashed_pwd = hash_password(seed_password)
+    countries = [Country.INDIA, Country.AMERICA]
+    roles = [UserRole.MEMBER, UserRole.MANAGER, UserRole.ADMIN]
+    statuses = [OrderStatus.PLACED, OrderStatus.COMPLETED, OrderStatus.CANCELLED]
+    
+    users_table = User.__table__
+    restaurants_table = Restaurant.__table__
+    menu_items_table = MenuItem.__table__
+    orders_table = Order.__table__
+    order_items_table = OrderItem.__table__
+    payment_methods_table = PaymentMethod.__table__
+    
+    started_at = time.perf_counter()
+    
+    with get_engine().begin() as conn:
+        already_seeded = conn.execute(
+            select(users_table.c.id).filter(users_table.c.email.like(f"%@{SYNTHETIC_EMAIL_DOMAIN}")).limit(1)
+        ).first()
+        if already_seeded:
+            print("Synthetic data already seeded")
+            return
+        
+        first_user_id = next_id(conn, users_table)
+        user_rows = [
+            (
+                first_user_id + n,
+                f"user{n}@{SYNTHETIC_EMAIL_DOMAIN}",
+                hashed_pwd,
+                f"Synthetic User {n}",
+                rng.choices(roles, weights=[80, 18, 2])[0],
+                rng.choice(countries)
+            )
+            for n in range(users)
+        ]
+        for start in range(0, users, batch_size):
+            bulk_insert(conn, users_table, ["id", "email", "password", "name", "role", "country"],
+                        user_rows[start:start + batch_size])
+        
+        first_restaurant_id = next_id(conn, restaurants_table)
+        restaurant_rows = [
+            (
+                first_restaurant_id + n,
+                f"Synthetic Restaurant {n}",
+                f"Generated restaurant number {n}",
+                rng.choice(countries)
+            )
+            for n in range(restaurants)
+        ]
+        bulk_insert(conn, restaurants_table, ["id", "name", "description", "country"], restaurant_rows)
+        
+        first_menu_item_id = next_id(conn, menu_items_table)
+        menu_by_country = {country: [] for country in countries}
+        menu_item_rows = []
+        for n in range(menu_items):
+            restaurant_id, _, _, country = restaurant_rows[n % restaurants]
+            price = round(rng.uniform(1, 500), 2)
+            menu_item_rows.append((
+                first_menu_item_id + n, restaurant_id, f"Dish {n}", "Generated menu item", price
+            ))
+            menu_by_country[country].append((first_menu_item_id + n, to_minor(price)))
+        for start in range(0, menu_items, batch_size):
+            bulk_insert(conn, menu_items_table, ["id", "restaurant_id", "name", "description", "price"],
+                        menu_item_rows[start:start + batch_size])
+        
+        first_payment_method_id = next_id(conn, payment_methods_table)
+        payment_method_rows = [
+            (
+                first_payment_method_id + n,
+                rng.choice(user_rows)[0],
+                rng.choice(list(PaymentType)),
+                f"{rng.randint(0, 9999):04d}",
+                False
+            )
+            for n in range(payment_methods)
+        ]
+        bulk_insert(conn, payment_methods_table, ["id", "user_id", "type", "last_four", "is_default"],
+                    payment_method_rows)
+        
+        user_ids = [(row[0], row[5]) for row in user_rows if menu_by_country[row[5]]]
+        next_order_id = next_id(conn, orders_table)
+        next_item_id = next_id(conn, order_items_table)
+    
+    now = datetime.utcnow()
+    for start in range(0, orders if user_ids else 0, batch_size):
+        order_rows = []
+        item_rows = []
+        for _ in range(start, min(start + batch_size, orders)):
+            user_id, country = rng.choice(user_ids)
+            created_at = now - timedelta(seconds=rng.randint(0, 365 * 24 * 3600))
+            menu = menu_by_country[country]
+            total_minor = 0
+            for menu_item_id, price_minor in rng.sample(menu, min(len(menu), rng.randint(1, items_per_order))):
+                quantity = rng.randint(1, 4)
+                item_rows.append((next_item_id, next_order_id, menu_item_id, quantity, price_minor))
+                total_minor += price_minor * quantity
+                next_item_id += 1
+            order_rows.append((
+                next_order_id, user_id, rng.choices(statuses, weights=[20, 70, 10])[0],
+                total_minor, country, created_at, created_at
+            ))
+            next_order_id += 1
+        
+        with get_engine().begin() as conn:
+            bulk_insert(conn, orders_table,
+                        ["id", "user_id", "status", "total_minor", "country", "created_at", "updated_at"],
+                        order_rows)
+            bulk_insert(conn, order_items_table,
+                        ["id", "order_id", "menu_item_id", "quantity", "price_minor"],
+                        item_rows)
+    
+    with get_engine().begin() as conn:
+        reset_sequences(conn, [users_table, restaurants_table, menu_items_table, orders_table,
+                               order_items_table, payment_methods_table])
+        rebuild_sales_reports(conn)
+    
+    print(
+        f"Seeded {users} users, {restaurants} restaurants, {menu_items} menu items, "
+        f"{payment_methods} payment methods and {orders} orders in {time.perf_counter() - started_at:.1f}s"
+    )
+    print(f"Synthetic users log in as user<n>@{SYNTHETIC_EMAIL_DOMAIN} (password: {seed_password})")
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be at least 0, got {number}")
+    return number
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Seed the Slooze Eats database")
+    parser.add_argument("--synthetic", action="store_true", help="add a generated dataset on top of the demo data")
+    parser.add_argument("--users", type=positive_int, default=1000)
+    parser.add_argument("--restaurants", type=positive_int, default=100)
+    parser.add_argument("--menu-items", type=non_negative_int, default=None, help="defaults to 12 per restaurant")
+    parser.add_argument("--orders", type=non_negative_int, default=10000)
+    parser.add_argument("--items-per-order", type=positive_int, default=5, help="maximum lines per order")
+    parser.add_argument("--payment-methods", type=non_negative_int, default=0)
+    parser.add_argument("--batch-size", type=positive_int, default=SYNTHETIC_BATCH_SIZE)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
     seed_database()
+    if args.synthetic:
+        seed_synthetic(
+            users=args.users,
+            restaurants=args.restaurants,
+            orders=args.orders,
+            seed=args.seed,
+            menu_items=args.menu_items,
+            items_per_order=args.items_per_order,
+            payment_methods=args.payment_methods,
+            batch_size=args.batch_size
+        )
@@ -0,0 +1,91 @@
+import argparse
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+# gunicorn executes this file as its config before changing directory.
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from app.config import settings
+
+try:
+    from uvicorn_worker import UvicornWorker
+except ImportError:
+    UvicornWorker = None
+
+# `gunicorn -c serve.py` reads the lowercase module-level names below.
+chdir = BACKEND_DIR
+wsgi_app = "app.main:app"
+bind = f"{settings.web_host}:{settings.web_port}"
+workers = settings.web_workers
+worker_class = "serve.DrainingUvicornWorker"
+preload_app = settings.web_preload
+graceful_timeout = settings.web_graceful_timeout
+keepalive = settings.web_keepalive_seconds
+max_requests = settings.web_max_requests
+max_requests_jitter = settings.web_max_requests_jitter
+
+if UvicornWorker is not None:
+    class DrainingUvicornWorker(UvicornWorker):
+        CONFIG_KWARGS = {**UvicornWorker.CONFIG_KWARGS, "timeout_graceful_shutdown": settings.web_graceful_timeout}
+
+
+def post_fork(server, worker):
+    # `-w` on the gunicorn command line wins over WEB_WORKERS; pool sizing
+    # happens lazily in the worker, so it sees the real count.
+    settings.web_workers = server.cfg.workers
+
+
+def per_worker_state_warnings(worker_count: int) -> list[str]:
+    if worker_count <= 1:
+        return []
+    warnings = []
+    if not settings.cache_url.startswith(("redis://", "rediss://", "unix://")):
+        warnings.append("CACHE_URL is in-memory: idempotency keys and read-replica pins are per worker")
+    if settings.rate_limit_enabled and not settings.rate_limit_url.startswith(("redis://", "rediss://", "unix://")):
+        warnings.append(f"RATE_LIMIT_URL is in-memory: each worker enforces its own limit ({worker_count}x overall)")
+    if not settings.push_broker_url.startswith(("redis://", "rediss://", "unix://")):
+        warnings.append("PUSH_BROKER_URL is in-memory: order event streams only see events drained by their own worker")
+    if settings.database_url.startswith("sqlite"):
+        warnings.append("SQLite serializes writes per process only; workers contend on the file lock (busy_timeout)")
+    return warnings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the Slooze Eats API with one or more worker processes")
+    parser.add_argument("--workers", type=int, default=settings.web_workers)
+    parser.add_argument("--host", default=settings.web_host)
+    parser.add_argument("--port", type=int, default=settings.web_port)
+    parser.add_argument("--no-preload", action="store_true", help="import the app in each worker instead of the master")
+    args = parser.parse_args()
+
+    # Workers build their own Settings, so pass the choices on through the environment.
+    os.environ["WEB_WORKERS"] = str(args.workers)
+    os.environ["WEB_HOST"] = args.host
+    os.environ["WEB_PORT"] = str(args.port)
+    if args.no_preload:
+        os.environ["WEB_PRELOAD"] = "false"
+
+    for warning in per_worker_state_warnings(args.workers):
+        print(f"warning: {warning}", file=sys.stderr)
+
+    if UvicornWorker is not None:
+        os.execvp(sys.executable, [sys.executable, "-m", "gunicorn", "-c", os.path.join(BACKEND_DIR, "serve.py")])
+
+    # gunicorn is POSIX-only; fall back to uvicorn's own supervisor (no preload).
+    import uvicorn
+
+    uvicorn.run(
+        wsgi_app,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        timeout_keep_alive=settings.web_keepalive_seconds,
+        timeout_graceful_shutdown=settings.web_graceful_timeout,
+        limit_max_requests=settings.web_max_requests or None
+    )
+
+
+if __name__ == "__main__":
+    main()
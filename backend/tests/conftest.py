@@ -0,0 +1,51 @@
+import os
+import tempfile
+
+# Settings are read at import time, so the test database has to be chosen first.
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp(prefix='slooze-tests-')}/test.db"
+os.environ["SEED_PASSWORD"] = "test-password"
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.environ["OUTBOX_WORKERS"] = "0"
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+import seed
+from app.database import get_async_engine
+from app.main import app
+
+
+class QueryRecorder(list):
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.append((statement, parameters))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    seed.seed_database()
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def login(client):
+    def login(email: str) -> dict:
+        response = client.post("/auth/login", json={"email": email, "password": os.environ["SEED_PASSWORD"]})
+        assert response.status_code == 200, response.text
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return login
+
+
+@pytest.fixture
+def queries(client):
+    recorder = QueryRecorder()
+    engine = get_async_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", recorder)
+    yield recorder
+    event.remove(engine, "before_cursor_execute", recorder)
@@ -0,0 +1,16 @@
+from app.admission import admission_stats
+from app.config import settings
+
+ORIGIN = "http://localhost:3000"
+
+
+def test_shed_responses_carry_cors_headers(client):
+    admission_stats.in_flight += settings.max_in_flight_requests
+    try:
+        response = client.get("/restaurants", headers={"Origin": ORIGIN})
+    finally:
+        admission_stats.in_flight -= settings.max_in_flight_requests
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == str(settings.load_shed_retry_after_seconds)
+    assert response.headers["access-control-allow-origin"] == ORIGIN
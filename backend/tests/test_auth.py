@@ -0,0 +1,74 @@
+import asyncio
+from functools import partial
+
+from sqlalchemy import select
+
+from app.auth.dependencies import pending_invalidations
+from app.auth.password import PasswordPoolBusy
+from app.database import AsyncSessionLocal, SessionLocal
+from app.models.user import Country, User, UserRole
+from app.routes import auth
+
+MEMBER = "thor@slooze.com"
+PROMOTED = "travis@slooze.com"
+
+
+async def busy_pool(password: str) -> str:
+    raise PasswordPoolBusy
+
+
+def test_login_succeeds_when_rehash_pool_is_busy(client, monkeypatch):
+    monkeypatch.setattr(auth, "password_needs_rehash", lambda hashed_password: True)
+    monkeypatch.setattr(auth, "hash_password_async", busy_pool)
+
+    response = client.post("/auth/login", json={"email": MEMBER, "password": "test-password"})
+
+    assert response.status_code == 200
+    assert client.get("/auth/me", headers={"Authorization": f"Bearer {response.json()['access_token']}"}).status_code == 200
+
+
+def change_user(email: str, **values):
+    with SessionLocal() as db:
+        user = db.scalar(select(User).filter(User.email == email))
+        for name, value in values.items():
+            setattr(user, name, value)
+        db.commit()
+
+
+async def change_user_async(email: str, **values):
+    async with AsyncSessionLocal() as db:
+        user = await db.scalar(select(User).filter(User.email == email))
+        for name, value in values.items():
+            setattr(user, name, value)
+        await db.commit()
+    await asyncio.gather(*pending_invalidations)
+
+
+def test_role_changes_from_sync_sessions_apply_on_the_next_request(client, login):
+    headers = login(PROMOTED)
+    assert client.get("/reports/sales", headers=headers).status_code == 403
+
+    change_user(PROMOTED, role=UserRole.MANAGER)
+    try:
+        me = client.get("/auth/me", headers=headers).json()
+        reports = client.get("/reports/sales", headers=headers)
+    finally:
+        change_user(PROMOTED, role=UserRole.MEMBER)
+
+    assert me["role"] == "manager"
+    assert reports.status_code == 200
+    assert client.get("/reports/sales", headers=headers).status_code == 403
+
+
+def test_country_changes_from_async_sessions_apply_on_the_next_request(client, login):
+    headers = login(PROMOTED)
+    assert client.get("/auth/me", headers=headers).json()["country"] == "america"
+
+    client.portal.call(partial(change_user_async, PROMOTED, country=Country.INDIA))
+    try:
+        me = client.get("/auth/me", headers=headers).json()
+    finally:
+        client.portal.call(partial(change_user_async, PROMOTED, country=Country.AMERICA))
+
+    assert me["country"] == "india"
+    assert client.get("/auth/me", headers=headers).json()["country"] == "america"
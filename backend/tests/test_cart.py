@@ -0,0 +1,87 @@
+import pytest
+from sqlalchemy import update
+
+from app.database import AsyncSessionLocal
+from app.models.order import Order
+from app.routes import orders
+
+MEMBER = "thanos@slooze.com"
+
+
+@pytest.fixture
+def member(client, login):
+    headers = login(MEMBER)
+    cart = client.get("/orders/cart", headers=headers).json()
+    if cart["items"]:
+        operations = [{"menu_item_id": item["menu_item_id"], "op": "remove"} for item in cart["items"]]
+        assert batch(client, headers, operations).status_code == 200
+    return headers
+
+
+def batch(client, headers, operations: list[dict]):
+    return client.post("/orders/cart/items/batch", json={"operations": operations}, headers=headers)
+
+
+def quantities(cart: dict) -> dict[int, int]:
+    return {item["menu_item_id"]: item["quantity"] for item in cart["items"]}
+
+
+def line_total(cart: dict) -> float:
+    return round(sum(item["price"] * item["quantity"] for item in cart["items"]), 2)
+
+
+def test_batch_applies_add_set_and_remove_in_order(client, member):
+    response = batch(client, member, [
+        {"menu_item_id": 1, "op": "add", "quantity": 2},
+        {"menu_item_id": 2, "op": "add", "quantity": 1},
+        {"menu_item_id": 3, "op": "set", "quantity": 4},
+        {"menu_item_id": 1, "op": "add", "quantity": 1},
+        {"menu_item_id": 2, "op": "remove"},
+    ])
+
+    assert response.status_code == 200
+    cart = response.json()
+    assert quantities(cart) == {1: 3, 3: 4}
+    assert cart["total_amount"] == line_total(cart)
+    assert client.get("/orders/cart", headers=member).json() == cart
+
+
+def test_batch_set_to_zero_deletes_the_line(client, member):
+    batch(client, member, [{"menu_item_id": 1, "quantity": 2}, {"menu_item_id": 4, "quantity": 1}])
+
+    cart = batch(client, member, [{"menu_item_id": 1, "op": "set", "quantity": 0}]).json()
+
+    assert quantities(cart) == {4: 1}
+    assert cart["total_amount"] == line_total(cart)
+
+
+def test_batch_with_unknown_item_changes_nothing(client, member):
+    before = batch(client, member, [{"menu_item_id": 1, "quantity": 2}]).json()
+
+    response = batch(client, member, [{"menu_item_id": 1, "quantity": 5}, {"menu_item_id": 99999, "quantity": 1}])
+
+    assert response.status_code == 404
+    assert "99999" in response.json()["detail"]
+    assert client.get("/orders/cart", headers=member).json() == before
+
+
+def test_batch_rolls_back_when_the_cart_changes_underneath(client, member, monkeypatch):
+    before = batch(client, member, [{"menu_item_id": 1, "quantity": 2}]).json()
+    read_cart_lines = orders.read_cart_lines
+
+    async def concurrent_write(db, cart_id):
+        version, lines = await read_cart_lines(db, cart_id)
+        async with AsyncSessionLocal() as other:
+            await other.execute(update(Order).filter(Order.id == cart_id).values(version=Order.version + 1))
+            await other.commit()
+        return version, lines
+
+    monkeypatch.setattr(orders, "read_cart_lines", concurrent_write)
+    response = batch(client, member, [
+        {"menu_item_id": 1, "op": "remove"},
+        {"menu_item_id": 2, "op": "set", "quantity": 3},
+        {"menu_item_id": 4, "quantity": 1},
+    ])
+
+    assert response.status_code == 409
+    assert client.get("/orders/cart", headers=member).json() == before
@@ -0,0 +1,44 @@
+from app.database import get_engine
+
+MANAGER = "marvel@slooze.com"
+
+
+def rename_restaurant(restaurant_id: int, name: str):
+    # Plain SQL on its own connection, like an admin script or another worker.
+    with get_engine().begin() as connection:
+        connection.exec_driver_sql("UPDATE restaurants SET name = ? WHERE id = ?", (name, restaurant_id))
+
+
+def test_catalog_edits_outside_the_api_are_served_fresh(client, login):
+    headers = login(MANAGER)
+    before = client.get("/restaurants/3", headers=headers)
+    listed = client.get("/restaurants", headers=headers)
+
+    rename_restaurant(3, "Renamed Express")
+    try:
+        detail = client.get("/restaurants/3", headers=headers)
+        relisted = client.get("/restaurants", headers=headers)
+    finally:
+        rename_restaurant(3, before.json()["name"])
+
+    assert detail.json()["name"] == "Renamed Express"
+    assert "Renamed Express" in [restaurant["name"] for restaurant in relisted.json()]
+    assert "Renamed Express" not in [restaurant["name"] for restaurant in listed.json()]
+
+
+def test_catalog_etags_follow_the_content(client, login):
+    headers = login(MANAGER)
+    before = client.get("/restaurants/2", headers=headers)
+    assert client.get("/restaurants/2", headers={**headers, "If-None-Match": before.headers["ETag"]}).status_code == 304
+
+    rename_restaurant(2, "Renamed Garden")
+    try:
+        revalidated = client.get("/restaurants/2", headers={**headers, "If-None-Match": before.headers["ETag"]})
+    finally:
+        rename_restaurant(2, before.json()["name"])
+    restored = client.get("/restaurants/2", headers=headers)
+
+    assert revalidated.status_code == 200
+    assert revalidated.json()["name"] == "Renamed Garden"
+    assert revalidated.headers["ETag"] != before.headers["ETag"]
+    assert restored.headers["ETag"] == before.headers["ETag"]
@@ -0,0 +1,73 @@
+import pytest
+
+from app.database import get_engine
+from app.routes import orders
+
+MANAGER = "marvel@slooze.com"
+
+
+@pytest.fixture
+def manager(client, login):
+    headers = login(MANAGER)
+    response = client.post("/orders/cart/items", json={"menu_item_id": 1, "quantity": 1}, headers=headers)
+    assert response.status_code == 200
+    return headers
+
+
+def placed_order_ids(client, headers) -> list[int]:
+    return [order["id"] for order in client.get("/orders", params={"limit": 200}, headers=headers).json()]
+
+
+def test_checkout_replays_the_response_for_a_repeated_idempotency_key(client, manager):
+    headers = {**manager, "Idempotency-Key": "replay-1"}
+    first = client.post("/orders/checkout", json={}, headers=headers)
+    placed = placed_order_ids(client, manager)
+
+    client.post("/orders/cart/items", json={"menu_item_id": 2, "quantity": 1}, headers=manager)
+    replayed = client.post("/orders/checkout", json={}, headers=headers)
+
+    assert first.status_code == replayed.status_code == 200
+    assert replayed.content == first.content
+    assert replayed.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+    assert placed_order_ids(client, manager) == placed
+    assert client.get("/orders/cart", headers=manager).json()["items"]
+
+
+def test_checkout_rejects_a_reused_key_with_a_different_body(client, manager):
+    headers = {**manager, "Idempotency-Key": "reused-1"}
+    assert client.post("/orders/checkout", json={}, headers=headers).status_code == 200
+
+    client.post("/orders/cart/items", json={"menu_item_id": 1, "quantity": 1}, headers=manager)
+    response = client.post("/orders/checkout", json={"payment_method_id": 1}, headers=headers)
+
+    assert response.status_code == 422
+
+
+def test_checkout_with_a_stale_if_match_fails(client, manager):
+    etag = client.get("/orders/cart", headers=manager).headers["ETag"]
+    client.post("/orders/cart/items", json={"menu_item_id": 2, "quantity": 1}, headers=manager)
+
+    response = client.post("/orders/checkout", json={}, headers={**manager, "If-Match": etag})
+
+    assert response.status_code == 412
+    assert client.get("/orders/cart", headers=manager).json()["items"]
+
+
+def test_checkout_losing_the_version_race_conflicts_and_releases_the_key(client, manager, monkeypatch):
+    cart_etag = orders.cart_etag
+
+    def concurrent_write(cart):
+        # Another request commits a cart change between the read and the swap.
+        with get_engine().begin() as connection:
+            connection.exec_driver_sql("UPDATE orders SET version = version + 1 WHERE id = ?", (cart.id,))
+        return cart_etag(cart)
+
+    headers = {**manager, "Idempotency-Key": "race-1", "If-Match": "*"}
+    monkeypatch.setattr(orders, "cart_etag", concurrent_write)
+    response = client.post("/orders/checkout", json={}, headers=headers)
+    monkeypatch.undo()
+
+    assert response.status_code == 409
+    assert client.get("/orders/cart", headers=manager).json()["items"]
+    assert client.post("/orders/checkout", json={}, headers=headers).status_code == 200
@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.push import push_hub
+from app.routes.events import SSE_RETRY_MS, order_event_stream
+
+MEMBER = "thor@slooze.com"
+
+
+@pytest.fixture
+def short_streams(monkeypatch):
+    monkeypatch.setattr(settings, "push_stream_max_seconds", 0)
+
+
+def stream_token(client, headers) -> str:
+    response = client.post("/events/token", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["expires_in"] == settings.stream_token_expire_seconds
+    return response.json()["stream_token"]
+
+
+def test_streams_accept_only_stream_tokens_in_the_query(client, login, short_streams):
+    headers = login(MEMBER)
+    access_token = headers["Authorization"].removeprefix("Bearer ")
+    token = stream_token(client, headers)
+
+    assert client.get("/events/orders", params={"stream_token": access_token}).status_code == 401
+    assert client.get("/events/orders", headers={"Authorization": f"Bearer {token}"}).status_code == 401
+    assert client.get("/orders", headers={"Authorization": f"Bearer {token}"}).status_code == 401
+
+    response = client.get("/events/orders", params={"stream_token": token})
+    assert response.status_code == 200
+    assert response.text == f"retry: {SSE_RETRY_MS}\n\n"
+
+
+def test_close_ends_a_stream_whose_queue_is_full():
+    async def drain():
+        subscriber = push_hub.subscribe(lambda event: True)
+        while not subscriber.queue.full():
+            subscriber.queue.put_nowait({"type": "order.placed"})
+        subscriber.close()
+        return [message async for message in order_event_stream(None, subscriber)]
+
+    assert asyncio.run(drain()) == [f"retry: {SSE_RETRY_MS}\n\n"]
+    assert not push_hub.subscribers
@@ -0,0 +1,69 @@
+import asyncio
+import csv
+import io
+
+import orjson
+import pytest
+
+from app.routes.orders import EXPORT_CSV_COLUMNS, export_ndjson
+
+ADMIN = "nick@slooze.com"
+MANAGER = "america@slooze.com"
+
+
+@pytest.fixture
+def admin(client, login):
+    headers = login(ADMIN)
+    for menu_item_id, email in [(1, "marvel@slooze.com"), (8, MANAGER)]:
+        manager = login(email)
+        client.post("/orders/cart/items", json={"menu_item_id": menu_item_id, "quantity": 2}, headers=manager)
+        assert client.post("/orders/checkout", json={}, headers=manager).status_code == 200
+    return headers
+
+
+def listed_orders(client, headers) -> dict[int, dict]:
+    return {order["id"]: order for order in client.get("/orders", params={"limit": 200}, headers=headers).json()}
+
+
+def test_ndjson_export_has_one_line_per_order(client, admin):
+    response = client.get("/orders/export", headers=admin)
+    exported = [orjson.loads(line) for line in response.text.splitlines()]
+    listed = listed_orders(client, admin)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [order["id"] for order in exported] == sorted(listed)
+    assert {order["country"] for order in exported} >= {"india", "america"}
+    for order in exported:
+        assert order["total_amount"] == listed[order["id"]]["total_amount"]
+        assert order["items"] == listed[order["id"]]["items"]
+
+
+def test_csv_export_has_one_row_per_order_line(client, admin):
+    response = client.get("/orders/export", params={"format": "csv"}, headers=admin)
+    header, *rows = csv.reader(io.StringIO(response.text))
+    listed = listed_orders(client, admin)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert header == EXPORT_CSV_COLUMNS
+    assert len(rows) == sum(max(1, len(order["items"])) for order in listed.values())
+    assert {(int(row[0]), int(row[6])) for row in rows if row[6]} == {
+        (order_id, item["id"]) for order_id, order in listed.items() for item in order["items"]
+    }
+
+
+def test_export_is_admin_only(client, login):
+    assert client.get("/orders/export", headers=login(MANAGER)).status_code == 403
+
+
+def test_ndjson_export_streams_before_reading_every_row():
+    async def rows():
+        yield (1, 1, "placed", "india", 7.0, "2026-01-01T00:00:00", 1, 1, "Naan", 2, 3.5)
+        yield (2, 1, "placed", "india", 3.5, "2026-01-01T00:00:00", 2, 1, "Naan", 1, 3.5)
+        raise AssertionError("read past the second order")
+
+    async def first_line():
+        return await export_ndjson(rows()).__anext__()
+
+    assert orjson.loads(asyncio.run(first_line()))["items"][0]["quantity"] == 2
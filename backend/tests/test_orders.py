@@ -0,0 +1,13 @@
+import pytest
+
+MEMBER = "thor@slooze.com"
+
+
+@pytest.mark.parametrize("quantity", [0, -3])
+def test_add_to_cart_rejects_non_positive_quantity(client, login, quantity):
+    headers = login(MEMBER)
+
+    response = client.post("/orders/cart/items", json={"menu_item_id": 1, "quantity": quantity}, headers=headers)
+
+    assert response.status_code == 422
+    assert client.get("/orders/cart", headers=headers).json()["total_amount"] == 0
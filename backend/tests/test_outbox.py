@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, select, update
+
+from app.config import settings
+from app.database import AsyncSessionLocal, get_engine
+from app.models.outbox import OutboxEvent
+from app.outbox import claim_events, enqueue_event, outbox_handlers, process_outbox_batch
+
+TOPIC = "test.outbox"
+
+
+@pytest.fixture
+def outbox(client, monkeypatch):
+    while client.portal.call(process_outbox_batch):
+        pass
+    calls = []
+    failures = []
+
+    async def handler(payload: dict):
+        calls.append(payload["n"])
+        if failures and failures.pop(0):
+            raise RuntimeError("handler failed")
+
+    monkeypatch.setitem(outbox_handlers, TOPIC, [handler])
+    yield client.portal, calls, failures
+    with get_engine().begin() as connection:
+        connection.execute(delete(OutboxEvent).filter(OutboxEvent.topic == TOPIC))
+
+
+async def enqueue(n: int):
+    async with AsyncSessionLocal() as db:
+        enqueue_event(db, TOPIC, {"n": n})
+        await db.commit()
+
+
+def events() -> list:
+    with get_engine().connect() as connection:
+        return connection.execute(select(OutboxEvent).filter(OutboxEvent.topic == TOPIC)).all()
+
+
+def make_due():
+    # Stands in for the lease or backoff running out.
+    with get_engine().begin() as connection:
+        connection.execute(
+            update(OutboxEvent).filter(OutboxEvent.topic == TOPIC).values(
+                available_at=datetime.utcnow() - timedelta(seconds=1)
+            )
+        )
+
+
+def test_claimed_events_are_leased(outbox):
+    portal, calls, failures = outbox
+    portal.call(enqueue, 1)
+
+    claimed = portal.call(claim_events, 10)
+    again = portal.call(claim_events, 10)
+
+    assert [event.attempts for event in claimed] == [1]
+    assert again == []
+    [event] = events()
+    assert event.available_at > datetime.utcnow() + timedelta(seconds=settings.outbox_lease_seconds - 5)
+    assert calls == []
+
+
+def test_events_from_an_expired_lease_are_redelivered(outbox):
+    portal, calls, failures = outbox
+    portal.call(enqueue, 2)
+    portal.call(claim_events, 10)
+
+    make_due()
+    portal.call(process_outbox_batch)
+
+    assert calls == [2]
+    assert events() == []
+
+
+def test_failed_deliveries_are_retried_with_backoff(outbox):
+    portal, calls, failures = outbox
+    failures.append(True)
+    portal.call(enqueue, 3)
+
+    portal.call(process_outbox_batch)
+    [event] = events()
+    assert event.attempts == 1
+    assert "handler failed" in event.last_error
+    assert event.available_at > datetime.utcnow()
+    assert portal.call(process_outbox_batch) == 0
+
+    make_due()
+    portal.call(process_outbox_batch)
+
+    assert calls == [3, 3]
+    assert events() == []
+
+
+def test_events_are_parked_after_max_attempts(outbox, monkeypatch):
+    portal, calls, failures = outbox
+    monkeypatch.setattr(settings, "outbox_max_attempts", 2)
+    failures.extend([True, True, True])
+    portal.call(enqueue, 4)
+
+    portal.call(process_outbox_batch)
+    make_due()
+    portal.call(process_outbox_batch)
+    make_due()
+    portal.call(process_outbox_batch)
+
+    [event] = events()
+    assert calls == [4, 4]
+    assert event.attempts == 2
+    assert event.failed_at is not None
@@ -0,0 +1,57 @@
+import base64
+
+import pytest
+
+from app.database import get_engine
+
+ADMIN = "nick@slooze.com"
+MANAGER = "marvel@slooze.com"
+TIED_WINDOW = {"created_from": "2001-01-01T00:00:00", "created_to": "2001-01-02T00:00:00"}
+
+
+@pytest.fixture(scope="module")
+def tied_orders(client, login):
+    headers = login(MANAGER)
+    order_ids = []
+    for _ in range(5):
+        client.post("/orders/cart/items", json={"menu_item_id": 3, "quantity": 1}, headers=headers)
+        order_ids.append(client.post("/orders/checkout", json={}, headers=headers).json()["id"])
+    with get_engine().begin() as connection:
+        connection.exec_driver_sql(
+            f"UPDATE orders SET created_at = '2001-01-01 12:00:00.000000' WHERE id IN ({','.join('?' * len(order_ids))})",
+            tuple(order_ids)
+        )
+    return sorted(order_ids, reverse=True)
+
+
+def pages(client, headers, limit: int) -> list[list[int]]:
+    result, cursor = [], None
+    while True:
+        params = {**TIED_WINDOW, "limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/orders", params=params, headers=headers)
+        assert response.status_code == 200
+        result.append([order["id"] for order in response.json()])
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return result
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3])
+def test_pages_neither_repeat_nor_skip_orders_with_tied_timestamps(client, login, tied_orders, limit):
+    result = pages(client, login(ADMIN), limit)
+
+    assert [order_id for page in result for order_id in page] == tied_orders
+    assert all(len(page) == limit for page in result[:-1])
+
+
+def test_the_last_page_has_no_cursor(client, login, tied_orders):
+    assert pages(client, login(ADMIN), len(tied_orders)) == [tied_orders]
+    assert pages(client, login(MANAGER), len(tied_orders) + 1) == [tied_orders]
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", base64.urlsafe_b64encode(b"yesterday|1").decode(), "%%%"])
+def test_malformed_cursors_are_rejected(client, login, cursor):
+    response = client.get("/orders", params={"cursor": cursor}, headers=login(ADMIN))
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
@@ -0,0 +1,64 @@
+import pytest
+
+MANAGER = "america@slooze.com"
+MENU_ITEMS = [8, 9, 10, 11, 12, 13, 14, 15]
+
+ORDER_LIST_QUERIES = 2
+CART_QUERIES = 3
+CHECKOUT_QUERIES = 10
+CANCEL_QUERIES = 9
+
+
+@pytest.fixture
+def manager(client, login):
+    headers = login(MANAGER)
+    client.get("/auth/me", headers=headers)
+    return headers
+
+
+def fill_cart(client, headers, lines: int):
+    for menu_item_id in MENU_ITEMS[:lines]:
+        response = client.post("/orders/cart/items", json={"menu_item_id": menu_item_id, "quantity": 2}, headers=headers)
+        assert response.status_code == 200
+
+
+def count_queries(queries, call) -> tuple[int, dict | list]:
+    queries.clear()
+    response = call()
+    assert response.status_code == 200, response.text
+    return len(queries), response.json()
+
+
+def item_ids(order: dict) -> list[int]:
+    return [item["id"] for item in order["items"]]
+
+
+def test_order_list_queries_do_not_grow_with_orders(client, manager, queries):
+    fill_cart(client, manager, 1)
+    client.post("/orders/checkout", json={}, headers=manager)
+    few_queries, few = count_queries(queries, lambda: client.get("/orders", headers=manager))
+
+    for _ in range(4):
+        fill_cart(client, manager, 3)
+        client.post("/orders/checkout", json={}, headers=manager)
+    many_queries, many = count_queries(queries, lambda: client.get("/orders", headers=manager))
+
+    assert len(many) == len(few) + 4
+    assert few_queries == many_queries == ORDER_LIST_QUERIES
+
+
+@pytest.mark.parametrize("lines", [1, len(MENU_ITEMS)])
+def test_cart_checkout_and_cancel_queries_do_not_grow_with_lines(client, manager, queries, lines):
+    fill_cart(client, manager, lines)
+
+    cart_queries, cart = count_queries(queries, lambda: client.get("/orders/cart", headers=manager))
+    checkout_queries, order = count_queries(queries, lambda: client.post("/orders/checkout", json={}, headers=manager))
+    cancel_queries, cancelled = count_queries(
+        queries, lambda: client.post(f"/orders/{order['id']}/cancel", headers=manager)
+    )
+
+    assert cart_queries == CART_QUERIES
+    assert checkout_queries == CHECKOUT_QUERIES
+    assert cancel_queries == CANCEL_QUERIES
+    assert item_ids(cart) == item_ids(order) == item_ids(cancelled) == sorted(item_ids(cart))
+    assert len(cancelled["items"]) == lines
@@ -0,0 +1,68 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.catalog import catalog_cache
+from app.database import get_engine
+from app.routes.orders import encode_cursor
+
+ADMIN = "nick@slooze.com"
+MANAGER = "marvel@slooze.com"
+MEMBER = "thanos@slooze.com"
+
+PAGE_CURSOR = encode_cursor(SimpleNamespace(created_at=datetime(2025, 1, 1), id=1000))
+
+HOT_PATHS = [
+    ("member order history", MEMBER, "/orders"),
+    ("member order history page", MEMBER, f"/orders?cursor={PAGE_CURSOR}"),
+    ("manager order history", MANAGER, "/orders"),
+    ("admin order list", ADMIN, "/orders"),
+    ("admin order list page", ADMIN, f"/orders?cursor={PAGE_CURSOR}"),
+    ("admin order list by status", ADMIN, "/orders?status=placed"),
+    ("admin order list by country", ADMIN, "/orders?country=india"),
+    ("admin order list by country page", ADMIN, f"/orders?country=america&cursor={PAGE_CURSOR}"),
+    ("admin order list by country and status", ADMIN, "/orders?country=india&status=placed"),
+    ("admin order list by date range", ADMIN, "/orders?created_from=2025-01-01T00:00:00"),
+    ("cart", MANAGER, "/orders/cart"),
+    ("restaurants by country", MANAGER, "/restaurants"),
+    ("restaurant detail", MANAGER, "/restaurants/1"),
+    ("payment methods", ADMIN, "/payments/methods"),
+    ("daily sales in range", ADMIN, "/reports/sales?date_from=2025-01-01&date_to=2025-01-31"),
+]
+
+
+def explain(statement: str, parameters) -> list[str]:
+    with get_engine().connect() as connection:
+        return [row[3] for row in connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)]
+
+
+def plan_problems(plan: list[str]) -> list[str]:
+    return [
+        line for line in plan
+        if (line.startswith("SCAN ") and " USING " not in line and "VIRTUAL TABLE" not in line)
+        or line.startswith("USE TEMP B-TREE")
+    ]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def placed_orders(client, login):
+    for email, menu_item_id in ((MANAGER, 1), (ADMIN, 8)):
+        headers = login(email)
+        client.post("/orders/cart/items", json={"menu_item_id": menu_item_id, "quantity": 1}, headers=headers)
+        assert client.post("/orders/checkout", json={}, headers=headers).status_code == 200
+
+
+@pytest.mark.parametrize("name, email, path", HOT_PATHS, ids=[name for name, _, _ in HOT_PATHS])
+def test_hot_path_uses_indexes(client, login, queries, name, email, path):
+    headers = login(email)
+    catalog_cache.clear()
+    queries.clear()
+
+    assert client.get(path, headers=headers).status_code == 200
+
+    selects = [(statement, parameters) for statement, parameters in queries if statement.lstrip().startswith("SELECT")]
+    assert selects
+    for statement, parameters in selects:
+        plan = explain(statement, parameters)
+        assert not plan_problems(plan), f"{statement}\n" + "\n".join(plan)
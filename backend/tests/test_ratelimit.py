@@ -0,0 +1,67 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import ratelimit
+from app.config import settings
+from app.main import app
+
+MEMBER = "thor@slooze.com"
+OTHER_MEMBER = "thanos@slooze.com"
+LOGIN_LIMIT = 10
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(settings, "rate_limit_enabled", True)
+    monkeypatch.setattr(ratelimit, "rate_limiter", ratelimit.MemoryRateLimiter())
+    monkeypatch.setattr(ratelimit, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def login(client, email: str = MEMBER):
+    return client.post("/auth/login", json={"email": email, "password": os.environ["SEED_PASSWORD"]})
+
+
+def test_the_eleventh_login_in_a_minute_is_rejected(client, clock):
+    assert [login(client).status_code for _ in range(LOGIN_LIMIT)] == [200] * LOGIN_LIMIT
+
+    response = login(client)
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == str(60 // LOGIN_LIMIT)
+
+
+def test_login_buckets_are_per_ip(client, clock):
+    for _ in range(LOGIN_LIMIT):
+        login(client)
+    assert login(client).status_code == 429
+
+    # Not entered as a context manager, so the app's lifespan is not run twice.
+    other_ip = TestClient(app, client=("10.0.0.2", 50000))
+    assert login(other_ip).status_code == 200
+
+
+def test_buckets_are_per_user(client, clock, monkeypatch):
+    monkeypatch.setitem(settings.rate_limits, "list_restaurants", "2/minute")
+    first = {"Authorization": f"Bearer {login(client).json()['access_token']}"}
+    second = {"Authorization": f"Bearer {login(client, OTHER_MEMBER).json()['access_token']}"}
+
+    assert [client.get("/restaurants", headers=first).status_code for _ in range(3)] == [200, 200, 429]
+    assert client.get("/restaurants", headers=second).status_code == 200
+
+
+def test_tokens_refill_over_time(client, clock):
+    for _ in range(LOGIN_LIMIT):
+        login(client)
+    assert login(client).status_code == 429
+
+    clock.value += 60 / LOGIN_LIMIT
+    assert login(client).status_code == 200
+    assert login(client).status_code == 429
+
+    clock.value += 60
+    assert [login(client).status_code for _ in range(LOGIN_LIMIT)] == [200] * LOGIN_LIMIT
@@ -0,0 +1,55 @@
+import sqlite3
+
+import pytest
+from sqlalchemy.engine import make_url
+
+from app import database
+from app.config import settings
+from app.replicas import primary_pins
+
+MANAGER = "america@slooze.com"
+READER = "nick@slooze.com"
+
+
+@pytest.fixture
+def replica(client, tmp_path, monkeypatch):
+    # A snapshot of the primary in a second SQLite file stands in for a lagging replica.
+    replica_path = tmp_path / "replica.db"
+    with sqlite3.connect(make_url(settings.database_url).database) as primary, sqlite3.connect(replica_path) as copy:
+        primary.backup(copy)
+
+    monkeypatch.setattr(settings, "database_replica_url", f"sqlite:///{replica_path}")
+    database.get_read_async_engine.cache_clear()
+    database.read_session_factory.cache_clear()
+    primary_pins.clear()
+    yield
+    client.portal.call(database.get_read_async_engine().dispose)
+    database.get_read_async_engine.cache_clear()
+    database.read_session_factory.cache_clear()
+
+
+def order_ids(client, headers) -> list[int]:
+    response = client.get("/orders", params={"limit": 200}, headers=headers)
+    assert response.status_code == 200
+    return [order["id"] for order in response.json()]
+
+
+def test_reads_use_the_replica_until_the_user_writes(client, login, replica):
+    manager, reader = login(MANAGER), login(READER)
+    before = order_ids(client, reader)
+
+    client.post("/orders/cart/items", json={"menu_item_id": 8, "quantity": 1}, headers=manager)
+    order = client.post("/orders/checkout", json={}, headers=manager).json()
+
+    assert order["id"] in order_ids(client, manager)
+    assert order_ids(client, reader) == before
+
+
+def test_pins_expire_back_to_the_replica(client, login, replica, monkeypatch):
+    manager = login(MANAGER)
+    monkeypatch.setattr(settings, "database_replica_pin_seconds", 0)
+
+    client.post("/orders/cart/items", json={"menu_item_id": 8, "quantity": 1}, headers=manager)
+    order = client.post("/orders/checkout", json={}, headers=manager).json()
+
+    assert order["id"] not in order_ids(client, manager)
@@ -0,0 +1,23 @@
+ADMIN = "nick@slooze.com"
+MANAGER = "america@slooze.com"
+AMERICAN_MENU_ITEM = 8
+AMERICAN_RESTAURANT = 4
+
+
+def restaurant_rows(client, headers) -> list[dict]:
+    response = client.get("/reports/sales", params={"group_by": "restaurant"}, headers=headers)
+    assert response.status_code == 200
+    return [row for row in response.json() if row["restaurant_id"] == AMERICAN_RESTAURANT]
+
+
+def test_restaurant_sales_are_labelled_with_the_order_country(client, login):
+    admin = login(ADMIN)
+    client.post("/orders/cart/items", json={"menu_item_id": AMERICAN_MENU_ITEM, "quantity": 1}, headers=admin)
+    assert client.post("/orders/checkout", json={}, headers=admin).status_code == 200
+
+    admin_rows = restaurant_rows(client, admin)
+    manager_rows = restaurant_rows(client, login(MANAGER))
+
+    assert "global" in [row["country"] for row in admin_rows]
+    assert all(row["country"] == "america" for row in manager_rows)
+    assert len({(row["restaurant_id"], row["country"]) for row in admin_rows}) == len(admin_rows)
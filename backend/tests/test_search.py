@@ -0,0 +1,52 @@
+from app.database import get_engine
+
+ADMIN = "nick@slooze.com"
+MANAGER = "marvel@slooze.com"
+
+
+def rename_menu_item(menu_item_id: int, name: str):
+    with get_engine().begin() as connection:
+        connection.exec_driver_sql("UPDATE menu_items SET name = ? WHERE id = ?", (name, menu_item_id))
+
+
+def search(client, headers, q: str) -> list[dict]:
+    response = client.get("/restaurants/search", params={"q": q}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def menu_item_ids(results: list[dict]) -> set[int]:
+    return {result["id"] for result in results if result["type"] == "menu_item"}
+
+
+def test_search_matches_word_prefixes(client, login):
+    results = search(client, login(ADMIN), "burg")
+
+    assert menu_item_ids(results) == {6, 8}
+
+
+def test_search_is_scoped_to_the_users_country(client, login):
+    results = search(client, login(MANAGER), "burg")
+
+    assert menu_item_ids(results) == {6}
+    assert {result["country"] for result in results} == {"india"}
+
+
+def test_search_without_terms_returns_nothing(client, login):
+    assert search(client, login(ADMIN), "!! ?") == []
+
+
+def test_edited_menu_items_are_reindexed(client, login):
+    headers = login(ADMIN)
+    original = search(client, headers, "margh")
+
+    rename_menu_item(12, "Zucchini Pizza")
+    try:
+        renamed = search(client, headers, "zucch")
+        stale = search(client, headers, "margh")
+    finally:
+        rename_menu_item(12, "Margherita Pizza")
+
+    assert 12 in menu_item_ids(original)
+    assert [result["name"] for result in renamed if result["type"] == "menu_item"] == ["Zucchini Pizza"]
+    assert 12 not in menu_item_ids(stale)
@@ -0,0 +1,10 @@
+import statistics
+
+from manage import STARTUP_BUDGET_MS, measure_cold_start
+
+
+def test_cold_start_within_budget():
+    samples = [measure_cold_start() for _ in range(3)]
+
+    assert not any(sample["engine_built_on_import"] for sample in samples)
+    assert statistics.median(sample["total_ms"] for sample in samples) <= STARTUP_BUDGET_MS